@@ -2,6 +2,8 @@ from . import version
 
 import paynt.utils.timer
 import paynt.parser.sketch
+import paynt.family.smt
+import paynt.verification.property
 
 import paynt.quotient.quotient
 import paynt.quotient.pomdp
@@ -12,6 +14,7 @@ import paynt.quotient.mdp
 
 import paynt.synthesizer.synthesizer
 import paynt.synthesizer.synthesizer_cegis
+import paynt.synthesizer.synthesizer_ar
 import paynt.synthesizer.policy_tree
 import paynt.synthesizer.decision_tree
 
@@ -61,6 +64,8 @@ def setup_logger(log_path = None):
     help="known optimum bound")
 @click.option("--precision", type=click.FLOAT, default=1e-4,
     help="model checking precision")
+@click.option("--abstraction-precision", type=click.FLOAT,
+    help="model checking precision for family abstractions in AR (default: --precision); members are always verified with --precision")
 @click.option("--exact", is_flag=True, default=False,
     help="use exact synthesis (very limited at the moment)")
 @click.option("--timeout", type=int,
@@ -75,6 +80,10 @@ def setup_logger(log_path = None):
     default="ar", show_default=True,
     help="synthesis method"
     )
+@click.option("--ar-exploration",
+    type=click.Choice(["dfs", "best"]),
+    default="dfs", show_default=True,
+    help="AR: order of exploring undecided families (best = most promising optimality bound first, dfs = depth-first)")
 
 @click.option("--disable-expected-visits", is_flag=True, default=False,
     help="do not compute expected visits for the splitting heuristic")
@@ -136,13 +145,15 @@ def setup_logger(log_path = None):
     "--ce-generator", type=click.Choice(["dtmc", "mdp"]), default="dtmc", show_default=True,
     help="counterexample generator",
 )
+@click.option("--bdd-design-space", is_flag=True, default=False,
+    help="CEGIS: use BDDs (requires package dd) instead of an SMT solver to represent the unexplored design space")
 @click.option("--profiling", is_flag=True, default=False,
     help="run profiling")
 
 def paynt_run(
-    project, sketch, props, relative_error, optimum_threshold, precision, exact, timeout,
+    project, sketch, props, relative_error, optimum_threshold, precision, abstraction_precision, exact, timeout,
     export,
-    method,
+    method, ar_exploration,
     disable_expected_visits,
     fsc_synthesis, fsc_memory_size, posterior_aware,
     storm_pomdp, iterative_storm, get_storm_result, storm_options, prune_storm,
@@ -151,7 +162,7 @@ def paynt_run(
     mdp_discard_unreachable_choices,
     tree_depth, tree_enumeration, tree_map_scheduler, add_dont_care_action,
     constraint_bound,
-    ce_generator,
+    ce_generator, bdd_design_space,
     profiling
 ):
 
@@ -167,6 +178,9 @@ def paynt_run(
     paynt.quotient.quotient.Quotient.disable_expected_visits = disable_expected_visits
     paynt.synthesizer.synthesizer.Synthesizer.export_synthesis_filename_base = export_synthesis
     paynt.synthesizer.synthesizer_cegis.SynthesizerCEGIS.conflict_generator_type = ce_generator
+    paynt.synthesizer.synthesizer_ar.SynthesizerAR.exploration_order_best_first = (ar_exploration == "best")
+    paynt.family.smt.SmtSolver.use_bdd_backend = bdd_design_space
+    paynt.verification.property.Property.abstraction_precision = abstraction_precision
     paynt.quotient.pomdp.PomdpQuotient.initial_memory_size = fsc_memory_size
     paynt.quotient.pomdp.PomdpQuotient.posterior_aware = posterior_aware
     paynt.quotient.decpomdp.DecPomdpQuotient.initial_memory_size = fsc_memory_size
@@ -22,6 +22,13 @@ class ParentInfo():
         self.selected_choices = None
         self.constraint_indices = None
         self.refinement_depth = None
+        # hole in which the subfamilies differ from the parent
+        self.splitter = None
+        # SMT solver that encoded the parent, the parent's hole clauses and restricted option counts
+        #   (None if the parent was not encoded)
+        self.encoding_smt_solver = None
+        self.hole_clauses = None
+        self.hole_num_restricted_options = None
 
 
 class Family:
@@ -31,10 +38,12 @@ class Family:
             self.family = payntbind.synthesis.Family()
             self.hole_to_name = []
             self.hole_to_option_labels = []
+            self._size = 1
         else:
             self.family = payntbind.synthesis.Family(other.family)
             self.hole_to_name = other.hole_to_name
             self.hole_to_option_labels = other.hole_to_option_labels
+            self._size = other._size
 
         self.parent_info = None
         self.refinement_depth = 0
@@ -58,6 +67,7 @@ class Family:
         self.hole_to_name.append(name)
         self.hole_to_option_labels.append(option_labels)
         self.family.addHole(len(option_labels))
+        self._size *= len(option_labels)
 
     def hole_name(self, hole):
         return self.hole_to_name[hole]
@@ -65,6 +75,9 @@ class Family:
     def hole_options(self, hole):
         return self.family.holeOptions(hole)
 
+    def hole_contains(self, hole, option):
+        return self.family.holeContains(hole, option)
+
     def hole_num_options(self, hole):
         return self.family.holeNumOptions(hole)
 
@@ -72,11 +85,19 @@ class Family:
         return self.family.holeNumOptionsTotal(hole)
 
     def hole_set_options(self, hole, options):
+        num_options_old = self.family.holeNumOptions(hole)
         self.family.holeSetOptions(hole,options)
+        if num_options_old == 0:
+            self._size = None
+        elif self._size is not None:
+            # only one hole has changed: update the cached size
+            self._size = self._size // num_options_old * self.family.holeNumOptions(hole)
 
     @property
     def size(self):
-        return math.prod([self.family.holeNumOptions(hole) for hole in range(self.num_holes)])
+        if self._size is None:
+            self._size = math.prod([self.family.holeNumOptions(hole) for hole in range(self.num_holes)])
+        return self._size
 
     INT_PRINT_MAX_ORDER = 5
 
@@ -125,16 +146,27 @@ class Family:
             subfamily.hole_set_options(hole,options)
         return subfamily
 
+    def assume_assignment_copy(self, hole_to_option):
+        '''
+        Create a copy where each hole is restricted to the single given option.
+        @note this does not check whether the options are actually options of any given hole.
+        '''
+        subfamily = self.copy()
+        for hole,option in enumerate(hole_to_option):
+            subfamily.family.holeSetOptions(hole,[option])
+        subfamily._size = 1
+        return subfamily
+
     def split(self, splitter, suboptions):
         return [self.assume_hole_options_copy(splitter,options) for options in suboptions]
 
     def pick_any(self):
-        hole_options = [[self.hole_options(hole)[0]] for hole in range(self.num_holes)]
-        return self.assume_options_copy(hole_options)
+        hole_to_option = [self.hole_options(hole)[0] for hole in range(self.num_holes)]
+        return self.assume_assignment_copy(hole_to_option)
 
     def pick_random(self):
-        hole_options = [[random.choice(self.hole_options(hole))] for hole in range(self.num_holes)]
-        return self.assume_options_copy(hole_options)
+        hole_to_option = [random.choice(self.hole_options(hole)) for hole in range(self.num_holes)]
+        return self.assume_assignment_copy(hole_to_option)
 
     def all_combinations(self):
         '''
@@ -148,10 +180,7 @@ class Family:
 
     def construct_assignment(self, combination):
         ''' Convert hole option combination to a hole assignment. '''
-        combination = list(combination)
-        suboptions = [[option] for option in combination]
-        assignment = self.assume_options_copy(suboptions)
-        return assignment
+        return self.assume_assignment_copy(combination)
 
     def collect_parent_info(self, specification):
         pi = ParentInfo()
@@ -159,8 +188,12 @@ class Family:
         pi.refinement_depth = self.refinement_depth
         cr = self.analysis_result.constraints_result
         pi.constraint_indices = cr.undecided_constraints if cr is not None else []
+        if self.encoding is not None:
+            pi.encoding_smt_solver = self.encoding.smt_solver
+            pi.hole_clauses = self.encoding.hole_clauses
+            pi.hole_num_restricted_options = self.encoding.hole_num_restricted_options
         return pi
 
     def encode(self, smt_solver):
         if self.encoding is None:
-            self.encoding = paynt.family.smt.FamilyEncoding(smt_solver, self)
+            self.encoding = paynt.family.smt.FamilyEncoding(smt_solver, self, self.parent_info)
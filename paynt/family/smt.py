@@ -6,51 +6,84 @@ import importlib
 if importlib.util.find_spec('pycvc5') is not None:
     import pycvc5
 
+# import BDD package dd if installed, prefer CUDD bindings
+dd_bdd = None
+if importlib.util.find_spec('dd') is not None:
+    try:
+        import dd.cudd as dd_bdd
+    except ImportError:
+        import dd.autoref as dd_bdd
+
 import logging
 logger = logging.getLogger(__name__)
 
 
 class FamilyEncoding():
 
-    def __init__(self, smt_solver, family):
+    def __init__(self, smt_solver, family, parent_info=None):
+        '''
+        :param parent_info if it contains the hole clauses of the parent encoded by the same solver, these will be
+            reused for all holes except for the splitter
+        '''
 
         self.smt_solver = smt_solver
         self.family = family
 
         # for each hole, a formula encoding its possible options
         self.hole_clauses = None
+        # for each hole, the number of its options in the family (0 if the hole is unrestricted)
+        self.hole_num_restricted_options = None
         # SMT formula describing the family
         self.encoding = None
         # set to False as soon as pick_assignment returns None
         self.has_assignments = True
-
-        hole_clauses = []
-        for hole in range(family.num_holes):
-            all_clauses = smt_solver.solver_clauses[hole]
-            clauses = [all_clauses[option] for option in family.hole_options(hole)]
-            if len(clauses) == 1:
-                or_clause = clauses[0]
-            else:
-                if smt_solver.use_python_z3:
-                    or_clause = z3.Or(clauses)
-                elif smt_solver.use_cvc:
-                    smt_solver = smt_solver.solver.mkTerm(pycvc5.Kind.Or, clauses)
-                else:
-                    pass
-            hole_clauses.append(or_clause)
-
-        if len(hole_clauses) == 1:
-            encoding = hole_clauses[0]
+        # if True, the encoding was asserted in the current solver scope and need not be passed as an assumption
+        self.asserted = False
+
+        if parent_info is not None and parent_info.hole_clauses is not None and parent_info.splitter is not None \
+                and parent_info.encoding_smt_solver is smt_solver:
+            splitter = parent_info.splitter
+            hole_clauses = parent_info.hole_clauses.copy()
+            hole_clauses[splitter] = FamilyEncoding.create_hole_options_clause(smt_solver, family, splitter)
+            hole_num_restricted_options = parent_info.hole_num_restricted_options.copy()
+            hole_num_restricted_options[splitter] = FamilyEncoding.hole_num_restricted(family, splitter)
         else:
-            if smt_solver.use_python_z3:
-                encoding = z3.And(hole_clauses)
-            elif smt_solver.use_cvc:
-                encoding = smt_solver.solver.mkTerm(pycvc5.Kind.And, hole_clauses)
-            else:
-                pass
+            hole_clauses = [FamilyEncoding.create_hole_options_clause(smt_solver, family, hole) for hole in range(family.num_holes)]
+            hole_num_restricted_options = [FamilyEncoding.hole_num_restricted(family, hole) for hole in range(family.num_holes)]
 
         self.hole_clauses = hole_clauses
-        self.encoding = encoding
+        self.hole_num_restricted_options = hole_num_restricted_options
+        self.encoding = smt_solver.create_and_clause(hole_clauses)
+        # flat list of literals disabling the options excluded from the family (constructed lazily)
+        self.assumptions = None
+
+
+    @staticmethod
+    def hole_num_restricted(family, hole):
+        num_options = family.hole_num_options(hole)
+        return num_options if num_options < family.hole_num_options_total(hole) else 0
+
+    @staticmethod
+    def create_hole_options_clause(smt_solver, family, hole):
+        ''' :return formula encoding the options of the hole in the family '''
+        if family.hole_num_options(hole) == family.hole_num_options_total(hole):
+            # unrestricted hole: reuse the disjunction shared by all families
+            return smt_solver.hole_clause_all_options(hole)
+        all_clauses = smt_solver.solver_clauses[hole]
+        clauses = [all_clauses[option] for option in family.hole_options(hole)]
+        return smt_solver.create_or_clause(clauses)
+
+    def create_assumptions(self):
+        ''' :return a list of literals disabling all options of restricted holes that are not in the family '''
+        assumptions = []
+        for hole in range(self.family.num_holes):
+            if self.family.hole_num_options(hole) == self.family.hole_num_options_total(hole):
+                continue
+            option_literals = self.smt_solver.solver_option_literals[hole]
+            for option in range(self.family.hole_num_options_total(hole)):
+                if not self.family.hole_contains(hole,option):
+                    assumptions.append(z3.Not(option_literals[option]))
+        return assumptions
 
 
     def pick_assignment(self):
@@ -59,33 +92,50 @@ class FamilyEncoding():
             return None
         
         if self.smt_solver.use_python_z3:
-            solver_result = self.smt_solver.solver.check(self.encoding)
+            if self.asserted:
+                solver_result = self.smt_solver.solver.check(*self.smt_solver.scope_selectors)
+            else:
+                if self.assumptions is None:
+                    self.assumptions = self.create_assumptions()
+                solver_result = self.smt_solver.solver.check(*self.smt_solver.scope_selectors, *self.assumptions)
             if solver_result == z3.unsat:
                 self.has_assignments = False
                 return None
             sat_model = self.smt_solver.solver.model()
-            hole_options = []
-            for hole_index,var in enumerate(self.smt_solver.solver_vars):
-                option = sat_model[var].as_long()
-                hole_options.append([option])
+            hole_to_option = [sat_model[var].as_long() for var in self.smt_solver.solver_vars]
         elif self.smt_solver.use_cvc:
-            solver_result = self.smt_solver.solver.checkSatAssuming(self.encoding)
+            if self.asserted:
+                solver_result = self.smt_solver.solver.checkSat()
+            else:
+                solver_result = self.smt_solver.solver.checkSatAssuming(self.encoding)
             if solver_result.isUnsat():
                 self.has_assignments = False
                 return None
-            hole_options = []
-            for hole_index,var in enumerate(self.smt_solver.solver_vars):
-                option = self.smt_solver.solver.getValue(var).getIntegerValue()
-                hole_options.append([option])
+            hole_to_option = [self.smt_solver.solver.getValue(var).getIntegerValue() for var in self.smt_solver.solver_vars]
+        elif self.smt_solver.use_bdd:
+            unexplored = self.smt_solver.bdd_scopes[-1]
+            if not self.asserted:
+                unexplored = unexplored & self.encoding
+            sat_model = self.smt_solver.solver.pick(unexplored, care_vars=self.smt_solver.bdd_care_vars)
+            if sat_model is None:
+                self.has_assignments = False
+                return None
+            hole_to_option = [
+                sum(1 << bit for bit,name in enumerate(bits) if sat_model[name])
+                for bits in self.smt_solver.solver_vars
+            ]
         else:
             pass            
         
-        assignment = self.family.assume_options_copy(hole_options)
+        assignment = self.family.assume_assignment_copy(hole_to_option)
         return assignment
 
         
 class SmtSolver():
 
+    # if True and package dd is installed, BDDs will be used instead of the SMT solver
+    use_bdd_backend = False
+
     def __init__(self, family):
 
         # SMT solver containing description of the unexplored design space
@@ -93,6 +143,7 @@ class SmtSolver():
         # SMT solver choice
         self.use_python_z3 = False
         self.use_cvc = False
+        self.use_bdd = False
     
         # for each hole contains a corresponding solver variable
         self.solver_vars = None
@@ -100,11 +151,32 @@ class SmtSolver():
         #   where h is the corresponding solver variable
         self.solver_clauses = None
 
+        # for each hole, a (lazily constructed) disjunction of all its clauses
+        self.solver_clauses_all = None
+
+        # Z3: for each hole, a list of activation literals [opt1,opt2,...] such that h==opt implies the literal,
+        #   families are then checked by assuming negations of the literals of the excluded options
+        self.solver_option_literals = None
+
         # current depth of push/pop solving
         self.solver_depth = 0
+        # Z3: instead of push/pop, formulae of each scope are guarded by a selector literal which is assumed in all
+        #   checks; a scope is closed by permanently asserting the negation of its selector, so that the lemmas the
+        #   solver has learned are kept
+        self.scope_selectors = []
+        self.num_scope_selectors = 0
+
+        # BDD backend: unexplored design space for each solver scope, names of all bit variables
+        self.bdd_scopes = None
+        self.bdd_care_vars = None
 
         # choose solver
-        if "pycvc5" in sys.modules:
+        if SmtSolver.use_bdd_backend and dd_bdd is None:
+            logger.warning("BDD backend requested but package dd is not installed, falling back to SMT solving.")
+        if SmtSolver.use_bdd_backend and dd_bdd is not None:
+            logger.debug("using BDDs for design space exploration.")
+            self.use_bdd = True
+        elif "pycvc5" in sys.modules:
             logger.debug("using CVC5 for SMT solving.")
             self.use_cvc = True
         else:
@@ -115,7 +187,12 @@ class SmtSolver():
         self.solver_clauses = []
         if self.use_python_z3:
             self.solver = z3.Solver()
-            self.solver_vars = [z3.Int(hole) for hole in range(family.num_holes)]
+            # holes have small finite domains: use bit-vectors wide enough to hold each option index, which lets
+            # z3 bit-blast the problem to SAT instead of reasoning in linear integer arithmetic
+            self.solver_vars = [
+                z3.BitVec(hole, max(1,(family.hole_num_options_total(hole)-1).bit_length()))
+                for hole in range(family.num_holes)
+            ]
         elif self.use_cvc:
             self.solver = pycvc5.Solver()
             self.solver.setOption("produce-models", "true")
@@ -127,6 +204,17 @@ class SmtSolver():
             # self.solver.setLogic("QF_UFLIA")
             intSort = self.solver.getIntegerSort()
             self.solver_vars = [self.solver.mkConst(intSort, str(hole)) for hole in range(family.num_holes)]
+        elif self.use_bdd:
+            # each hole is encoded by a vector of boolean variables holding the binary representation of the option
+            self.solver = dd_bdd.BDD()
+            self.solver_vars = []
+            for hole in range(family.num_holes):
+                width = max(1,(family.hole_num_options_total(hole)-1).bit_length())
+                bits = [f"h{hole}_{bit}" for bit in range(width)]
+                self.solver.declare(*bits)
+                self.solver_vars.append(bits)
+            self.bdd_care_vars = set(name for bits in self.solver_vars for name in bits)
+            self.bdd_scopes = [self.solver.true]
         else:
             raise RuntimeError("Need to enable at least one SMT solver.")
 
@@ -136,6 +224,19 @@ class SmtSolver():
             var = self.solver_vars[hole]
             clauses = [self.create_hole_clause(hole,option) for option in family.hole_options(hole)]
             self.solver_clauses.append(clauses)
+        self.solver_clauses_all = [None] * family.num_holes
+        self.hole_num_options_total = [family.hole_num_options_total(hole) for hole in range(family.num_holes)]
+
+        if self.use_python_z3:
+            # permanently restrict each variable to the options of its hole and bind the options to the activation
+            # literals, so that the checks need no formula rebuilding and reuse the learned clauses
+            self.solver_option_literals = []
+            for hole in range(family.num_holes):
+                literals = [z3.Bool(f"opt_{hole}_{option}") for option in family.hole_options(hole)]
+                for option,literal in enumerate(literals):
+                    self.solver.add(z3.Implies(self.solver_clauses[hole][option], literal))
+                self.solver.add(self.hole_clause_all_options(hole))
+                self.solver_option_literals.append(literals)
 
 
     def create_hole_clause(self, hole, option):
@@ -144,10 +245,60 @@ class SmtSolver():
             return var == option
         elif self.use_cvc:
             return self.solver.mkTerm(pycvc5.Kind.Equal, var, self.solver.mkInteger(option))
+        elif self.use_bdd:
+            clause = self.solver.true
+            for bit,name in enumerate(var):
+                literal = self.solver.var(name)
+                clause = clause & (literal if (option >> bit) & 1 else ~literal)
+            return clause
         else:
             return None
 
 
+    def create_or_clause(self, clauses):
+        if len(clauses) == 1:
+            return clauses[0]
+        if self.use_python_z3:
+            return z3.Or(clauses)
+        elif self.use_cvc:
+            return self.solver.mkTerm(pycvc5.Kind.Or, clauses)
+        elif self.use_bdd:
+            clause = self.solver.false
+            for c in clauses:
+                clause = clause | c
+            return clause
+        else:
+            return None
+
+    def create_and_clause(self, clauses):
+        if len(clauses) == 1:
+            return clauses[0]
+        if self.use_python_z3:
+            return z3.And(clauses)
+        elif self.use_cvc:
+            return self.solver.mkTerm(pycvc5.Kind.And, clauses)
+        elif self.use_bdd:
+            clause = self.solver.true
+            for c in clauses:
+                clause = clause & c
+            return clause
+        else:
+            return None
+
+    def hole_clause_all_options(self, hole):
+        ''' :return a cached disjunction h==opt1 | h==opt2 | ... over all options of the hole '''
+        if self.solver_clauses_all[hole] is None:
+            self.solver_clauses_all[hole] = self.create_or_clause(self.solver_clauses[hole])
+        return self.solver_clauses_all[hole]
+
+
+    def add_scoped(self, formula):
+        ''' Z3: assert the formula in the current solver scope. '''
+        if len(self.scope_selectors) == 0:
+            self.solver.add(formula)
+        else:
+            self.solver.add(z3.Implies(self.scope_selectors[-1], formula))
+
     def pick_assignment(self, family):
         '''
         :return unexplored hole assignment from the family
@@ -156,6 +307,25 @@ class SmtSolver():
         family.encode(self)
         return family.encoding.pick_assignment()
 
+    def assert_family(self, family):
+        '''
+        Assert the family encoding in the current solver scope: subsequent picks from this family are then issued
+        without assumptions, allowing the solver to reuse its state between the checks.
+        @note the caller is responsible for opening a fresh scope (see level) before asserting a subfamily
+        '''
+        family.encode(self)
+        if family.encoding.asserted:
+            return
+        if self.use_python_z3:
+            self.add_scoped(family.encoding.encoding)
+        elif self.use_cvc:
+            self.solver.assertFormula(family.encoding.encoding)
+        elif self.use_bdd:
+            self.bdd_scopes[-1] = self.bdd_scopes[-1] & family.encoding.encoding
+        else:
+            pass
+        family.encoding.asserted = True
+
     def pick_assignment_priority(self, family, priority_subfamily):
 
         if priority_subfamily is None:
@@ -175,9 +345,16 @@ class SmtSolver():
         :param conflicts a list of conflicts (may be empty)
         :return estimate of pruned assignments
         '''
+        # conflicts of different properties often coincide: a conflict that contains an already excluded conflict
+        #   prunes nothing new, exclude only the minimal ones
         pruning_estimate = 0
-        for conflict in conflicts:
-            pruning_estimate += self.exclude_conflict(family, assignment, conflict)
+        excluded = []
+        for conflict in sorted(conflicts, key=len):
+            conflict_set = set(conflict)
+            if any(excluded_set <= conflict_set for excluded_set in excluded):
+                continue
+            excluded.append(conflict_set)
+            pruning_estimate += self.exclude_conflict(family, assignment, conflict_set)
         return pruning_estimate
     
     
@@ -194,23 +371,26 @@ class SmtSolver():
         if family.encoding is None:
             family.encoding = FamilyEncoding(self, family)
 
+        # the option counts and clauses of the family holes are prepared once per family in its encoding
+        encoding = family.encoding
         pruning_estimate = 1
         counterexample_clauses = []
-        for hole,var in enumerate(self.solver_vars):
+        for hole,num_restricted_options in enumerate(encoding.hole_num_restricted_options):
             if hole in conflict:
                 option = assignment.hole_options(hole)[0]
                 counterexample_clauses.append(self.solver_clauses[hole][option])
+            elif num_restricted_options > 0:
+                counterexample_clauses.append(encoding.hole_clauses[hole])
+                pruning_estimate *= num_restricted_options
             else:
-                if family.hole_num_options(hole) < family.hole_num_options_total(hole):
-                    counterexample_clauses.append(family.encoding.hole_clauses[hole])
-                pruning_estimate *= family.hole_num_options(hole)
+                pruning_estimate *= self.hole_num_options_total[hole]
 
         if self.use_python_z3:
             if len(counterexample_clauses) == 0:
                 counterexample_encoding = False
             else:
                 counterexample_encoding = z3.Not(z3.And(counterexample_clauses))
-            self.solver.add(counterexample_encoding)
+            self.add_scoped(counterexample_encoding)
         elif self.use_cvc:
             if len(counterexample_clauses) == 0:
                 counterexample_encoding = self.solver.mkFalse()
@@ -219,6 +399,12 @@ class SmtSolver():
             else:
                 counterexample_encoding = self.solver.mkTerm(pycvc5.Kind.And, counterexample_clauses).notTerm()
             self.solver.assertFormula(counterexample_encoding)
+        elif self.use_bdd:
+            if len(counterexample_clauses) == 0:
+                self.bdd_scopes[-1] = self.solver.false
+            else:
+                counterexample_encoding = ~self.create_and_clause(counterexample_clauses)
+                self.bdd_scopes[-1] = self.bdd_scopes[-1] & counterexample_encoding
         else:
             pass
 
@@ -234,10 +420,21 @@ class SmtSolver():
 
         # reset to the scope of the parent (refinement_depth - 1)
         while self.solver_depth >= refinement_depth:
-            self.solver.pop()
+            if self.use_python_z3:
+                self.solver.add(z3.Not(self.scope_selectors.pop()))
+            elif self.use_bdd:
+                self.bdd_scopes.pop()
+            else:
+                self.solver.pop()
             self.solver_depth -= 1
 
         # create new scope
-        self.solver.push()
+        if self.use_python_z3:
+            self.scope_selectors.append(z3.Bool(f"scope_{self.num_scope_selectors}"))
+            self.num_scope_selectors += 1
+        elif self.use_bdd:
+            self.bdd_scopes.append(self.bdd_scopes[-1])
+        else:
+            self.solver.push()
         self.solver_depth += 1
 
@@ -34,9 +34,13 @@ class Mdp:
     def initial_state(self):
         return self.model.initial_states[0]
 
-    def model_check_property(self, prop, alt=False):
+    def model_check_property(self, prop, alt=False, abstraction=False):
+        '''
+        :param abstraction if True, the model is an abstraction of a family and can be checked using the precision
+            for abstractions
+        '''
         formula = prop.formula if not alt else prop.formula_alt
-        result = paynt.verification.property.Property.model_check(self.model,formula)
+        result = paynt.verification.property.Property.model_check(self.model,formula,abstraction=abstraction)
         value = result.at(self.initial_state)
         return paynt.verification.property_result.PropertyResult(prop, result, value)
 
@@ -44,9 +48,12 @@ class Mdp:
         ''' Assuming this is a DTMC. '''
         if constraint_indices is None:
             constraint_indices = spec.all_constraint_indices()
+        # properties sharing the operator and the path formula have the same value on a DTMC regardless of their
+        # bounds or optimization direction: each such formula is model checked once
+        dtmc_results = {}
         results = [None for _ in spec.constraints]
         for index in constraint_indices:
-            result = self.model_check_property(spec.constraints[index])
+            result = self.model_check_property_dtmc(spec.constraints[index], dtmc_results)
             results[index] = result
             if short_evaluation and result.sat is False:
                 break
@@ -54,9 +61,23 @@ class Mdp:
         spec_result.constraints_result = paynt.verification.property_result.ConstraintsResult(results)
 
         if spec.has_optimality and not (short_evaluation and spec_result.constraints_result.sat is False):
-            spec_result.optimality_result = self.model_check_property(spec.optimality)
+            spec_result.optimality_result = self.model_check_property_dtmc(spec.optimality, dtmc_results)
         return spec_result
 
+    def model_check_property_dtmc(self, prop, dtmc_results):
+        '''
+        Model check the property on this DTMC, reusing the result of a formula with the same value.
+        :param dtmc_results a dictionary of results computed so far for this DTMC, will be updated
+        '''
+        if not self.is_deterministic:
+            return self.model_check_property(prop)
+        key = prop.dtmc_formula_key
+        if key not in dtmc_results:
+            result = paynt.verification.property.Property.model_check(self.model,prop.formula)
+            dtmc_results[key] = (result, result.at(self.initial_state))
+        result,value = dtmc_results[key]
+        return paynt.verification.property_result.PropertyResult(prop, result, value)
+
 
 
 class SubMdp(Mdp):
@@ -72,12 +93,13 @@ class Smg(Mdp):
     def __init__(self, model):
         super().__init__(model)
 
-    def model_check_property(self, prop, alt=False):
+    def model_check_property(self, prop, alt=False, abstraction=False):
         formula = prop.game_formula if not alt else prop.game_formula_alt
 
+        environment = paynt.verification.property.Property.get_environment(abstraction)
         result = payntbind.synthesis.model_check_smg(self.model, formula,
                                                         only_initial_states=False, set_produce_schedulers=True,
-                                                        env=paynt.verification.property.Property.environment)
+                                                        env=environment)
 
         value = result.at(self.model.initial_states[0])
         return paynt.verification.property_result.PropertyResult(prop, result, value)
@@ -143,10 +143,11 @@ observations: {}
         desc += "# transition matrix\n\n"
 
         tm = pomdp.transition_matrix
+        nci = pomdp.nondeterministic_choice_indices.copy()
         for state in range(num_states):
             action_index = 0
-            group_start = tm.get_row_group_start(state)
-            group_end = tm.get_row_group_end(state)
+            group_start = nci[state]
+            group_end = nci[state+1]
             trivial_action = group_end == group_start + 1
             for row_index in range(group_start, group_end):
                 for entry in tm.get_row(row_index):
@@ -174,8 +175,7 @@ observations: {}
             elif rewards.has_state_action_rewards:
                 state_action_rewards = list(rewards.state_action_rewards)
                 for state in range(num_states):
-                    group_start = tm.get_row_group_start(state)
-                    state_rewards.append(state_action_rewards[group_start])
+                    state_rewards.append(state_action_rewards[nci[state]])
             else:
                 raise TypeError("unknown reward type")
 
@@ -13,7 +13,8 @@ logger = logging.getLogger(__name__)
 
 class CombinationColoring:
     '''
-    Dictionary of colors associated with different hole combinations.
+    Dictionary of colors associated with different hole combinations. Each combination is a tuple of
+    (hole,option) pairs sorted by hole index, listing only the holes relevant for the colored object.
     Note: color 0 is reserved for general hole-free objects.
     '''
     def __init__(self):
@@ -25,10 +26,9 @@ class CombinationColoring:
         return len(self.coloring)
 
     def get_or_make_color(self, hole_assignment):
-        new_color = self.num_colors + 1
-        color = self.coloring.get(hole_assignment, new_color)
+        new_color = len(self.coloring) + 1
+        color = self.coloring.setdefault(hole_assignment, new_color)
         if color == new_color:
-            self.coloring[hole_assignment] = color
             self.reverse_coloring.append(hole_assignment)
         return color
 
@@ -121,9 +121,7 @@ class JaniUnfolder:
                 if edge.color == 0:
                     continue
                 global_index = jani_program.encode_automaton_and_edge_index(aut_index, edge_index)
-                options = combination_coloring.reverse_coloring[edge.color]
-                options = [(hole_index,option) for hole_index,option in enumerate(options) if option is not None]
-                edge_to_hole_options[global_index] = options
+                edge_to_hole_options[global_index] = list(combination_coloring.reverse_coloring[edge.color])
 
         return jani_program,edge_to_hole_options
 
@@ -179,7 +177,8 @@ class JaniUnfolder:
                 if combination[hole] is not None
             }
             new_edge = JaniUnfolder.construct_edge(edge,substitution)
-            new_edge.color = combination_coloring.get_or_make_color(combination)
+            hole_options = tuple((hole,combination[hole]) for hole in edge_holes)
+            new_edge.color = combination_coloring.get_or_make_color(hole_options)
             new_edges.append(new_edge)
         return new_edges
 
@@ -31,7 +31,7 @@ def substitute_suffix(string, delimiter, replacer):
 
 
 def make_rewards_action_based(model):
-    tm = model.transition_matrix
+    nci = model.nondeterministic_choice_indices.copy()
     for name,reward_model in model.reward_models.items():
         assert not reward_model.has_transition_rewards, "Paynt does not support transition rewards"
         if not reward_model.has_state_rewards:
@@ -45,7 +45,7 @@ def make_rewards_action_based(model):
 
         for state in range(model.nr_states):
             state_reward = reward_model.get_state_reward(state)
-            for action in range(tm.get_row_group_start(state),tm.get_row_group_end(state)):
+            for action in range(nci[state],nci[state+1]):
                 action_reward[action] += state_reward
 
         if model.is_exact:
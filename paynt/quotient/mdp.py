@@ -531,28 +531,23 @@ class MdpQuotient(paynt.quotient.quotient.Quotient):
 
         for hole,options in enumerate(hole_selection):
             for option in options:
-                assert option in mdp.family.hole_options(hole), \
+                assert mdp.family.hole_contains(hole,option), \
                 f"option {option} for hole {hole} ({mdp.family.hole_name(hole)}) is not in the family"
 
         return hole_selection, consistent
 
 
     def scheduler_scores(self, mdp, prop, result, selection):
-        inconsistent_assignments = {hole:options for hole,options in enumerate(selection) if len(options) > 1 }
-        assert len(inconsistent_assignments) > 0, f"obtained selection with no inconsistencies: {selection}"
-        inconsistent_action_holes = [(hole,options) for hole,options in inconsistent_assignments.items() if self.is_action_hole[hole]]
-        inconsistent_decision_holes = [(hole,options) for hole,options in inconsistent_assignments.items() if self.is_decision_hole[hole]]
-        inconsistent_variable_holes = [(hole,options) for hole,options in inconsistent_assignments.items() if self.is_variable_hole[hole]]
+        inconsistent_holes = [hole for hole,options in enumerate(selection) if len(options) > 1]
+        assert len(inconsistent_holes) > 0, f"obtained selection with no inconsistencies: {selection}"
 
         # choose one splitter
-        splitter = None
         # try action or decision holes first
-        if len(inconsistent_action_holes) > 0:
-            splitter = inconsistent_action_holes[0][0]
-        elif len(inconsistent_decision_holes) > 0:
-            splitter = inconsistent_decision_holes[0][0]
-        else:
-            splitter = inconsistent_variable_holes[0][0]
+        splitter = next((hole for hole in inconsistent_holes if self.is_action_hole[hole]), None)
+        if splitter is None:
+            splitter = next((hole for hole in inconsistent_holes if self.is_decision_hole[hole]), None)
+        if splitter is None:
+            splitter = next((hole for hole in inconsistent_holes if self.is_variable_hole[hole]), None)
         assert splitter is not None, "splitter not set"
         # force the score of the selected splitter
         return {splitter:10}
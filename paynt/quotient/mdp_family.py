@@ -15,9 +15,10 @@ class MdpFamilyQuotient(paynt.quotient.quotient.Quotient):
     @staticmethod
     def map_state_action_to_choices(mdp, num_actions, choice_to_action):
         state_action_choices = []
+        nci = mdp.nondeterministic_choice_indices.copy()
         for state in range(mdp.nr_states):
             action_choices = [[] for action in range(num_actions)]
-            for choice in mdp.transition_matrix.get_rows_for_group(state):
+            for choice in range(nci[state],nci[state+1]):
                 action = choice_to_action[choice]
                 action_choices[action].append(choice)
             state_action_choices.append(action_choices)
@@ -37,6 +37,8 @@ class PomdpQuotient(paynt.quotient.quotient.Quotient):
         self.pomdp = None
         # a (simplified) label for each observation
         self.observation_labels = None
+        # for each observation label, the (first) observation having this label
+        self.observation_label_to_observation = None
         # number of actions available at each observation
         self.actions_at_observation = None
         # action labels corresponding to ^
@@ -48,6 +50,8 @@ class PomdpQuotient(paynt.quotient.quotient.Quotient):
 
         # number of memory states allocated to each observation
         self.observation_memory_size = None
+        # memory vector of the current unfolding
+        self.unfolded_memory_size = None
         # Storm POMDP manager
         self.pomdp_manager = None
 
@@ -82,6 +86,9 @@ class PomdpQuotient(paynt.quotient.quotient.Quotient):
                     agent_obs = decpomdp_manager.joint_observations[obs][0]
                     agent_obs_label = decpomdp_manager.agent_observation_labels[0][agent_obs]
                     self.observation_labels.append(agent_obs_label)
+        self.observation_label_to_observation = {}
+        for obs,label in enumerate(self.observation_labels):
+            self.observation_label_to_observation.setdefault(label,obs)
 
         # compute actions available at each observation
         self.actions_at_observation = [0] * self.observations
@@ -158,11 +165,7 @@ class PomdpQuotient(paynt.quotient.quotient.Quotient):
         observation_label = result.group(2)
         memory = int(result.group(3))
 
-        observation = None
-        for obs in range(self.observations):
-            if observation_label == self.observation_labels[obs]:
-                observation = obs
-                break
+        observation = self.observation_label_to_observation.get(observation_label)
         return (is_action_hole, observation, memory)
 
     def set_manager_memory_vector(self):
@@ -334,6 +337,14 @@ class PomdpQuotient(paynt.quotient.quotient.Quotient):
 
     def unfold_memory(self):
 
+        memory_size = tuple(self.observation_memory_size)
+        if self.quotient_mdp is not None and memory_size == self.unfolded_memory_size:
+            # same memory vector as the current unfolding: keep the quotient, provide a fresh copy of the family
+            logger.debug("memory vector has not changed, reusing the unfolded quotient MDP")
+            self.family = self.family.copy()
+            return
+        self.unfolded_memory_size = memory_size
+
         # reset attributes
         self.quotient_mdp = None
         self.coloring = None
@@ -381,10 +392,9 @@ class PomdpQuotient(paynt.quotient.quotient.Quotient):
 
         # map choices to their origin states
         choice_to_state = []
-        tm = mdp.transition_matrix
+        nci = mdp.nondeterministic_choice_indices.copy()
         for state in range(mdp.nr_states):
-            for choice in tm.get_rows_for_group(state):
-                choice_to_state.append(state)
+            choice_to_state.extend([state] * (nci[state+1]-nci[state]))
 
         # for each hole, compute its difference sum and a number of affected states
         inconsistent_differences = {}
@@ -151,18 +151,26 @@ class PomdpFamilyQuotient(paynt.quotient.mdp_family.MdpFamilyQuotient):
         return state_memory_action_to_value
 
 
-    def translate_path_to_trace(self, dtmc, path):
+    def translate_path_to_trace(self, dtmc, path, product_choice_to_choice=None, product_state_to_state=None):
+        '''
+        :param product_choice_to_choice,product_state_to_state maps of the product FSC; if not provided, these will be
+            retrieved from the product, which requires a copy of each map
+        '''
+        if product_choice_to_choice is None:
+            product_choice_to_choice = self.product_pomdp_fsc.product_choice_to_choice
+        if product_state_to_state is None:
+            product_state_to_state = self.product_pomdp_fsc.product_state_to_state
         invalid_choice = self.quotient_mdp.nr_choices
         trace = []
         for dtmc_state in path:
             product_choice = dtmc.quotient_choice_map[dtmc_state]
-            choice = self.product_pomdp_fsc.product_choice_to_choice[product_choice]
+            choice = product_choice_to_choice[product_choice]
             if choice == invalid_choice:
                 # randomized FSC: we are in the intermediate state, move on to the next one
                 continue
             
             product_state = dtmc.quotient_state_map[dtmc_state]
-            state = self.product_pomdp_fsc.product_state_to_state[product_state]
+            state = product_state_to_state[product_state]
             obs = self.state_to_observation[state]
             action = self.choice_to_action[choice]
             trace.append( (obs,action) )
@@ -203,6 +211,10 @@ class PomdpFamilyQuotient(paynt.quotient.mdp_family.MdpFamilyQuotient):
         target_label = self.extract_target_label()
         target_states = dtmc.model.labeling.get_states(target_label)
 
+        # retrieve the maps of the product once rather than in every step of every trace
+        product_choice_to_choice = self.product_pomdp_fsc.product_choice_to_choice
+        product_state_to_state = self.product_pomdp_fsc.product_state_to_state
+
         traces = []
         if target_states.number_of_set_bits()==0:
             # target is not reachable: use Stormpy simulator to obtain some random walk in a DTMC
@@ -216,7 +228,7 @@ class PomdpFamilyQuotient(paynt.quotient.mdp_family.MdpFamilyQuotient):
                     if not success:
                         break
                     path.append(simulator.get_current_state())
-                trace = self.translate_path_to_trace(dtmc,path)
+                trace = self.translate_path_to_trace(dtmc,path,product_choice_to_choice,product_state_to_state)
                 traces.append(trace)
         else:
             # target is reachable: use KSP
@@ -232,6 +244,6 @@ class PomdpFamilyQuotient(paynt.quotient.mdp_family.MdpFamilyQuotient):
             for k in range(1,num_traces+1):
                 path = shortest_paths_generator.get_path_as_list(k)
                 path.reverse()
-                trace = self.translate_path_to_trace(dtmc,path)
+                trace = self.translate_path_to_trace(dtmc,path,product_choice_to_choice,product_state_to_state)
                 traces.append(trace)
         return traces
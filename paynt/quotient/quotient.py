@@ -78,7 +78,12 @@ class Quotient:
     def build(self, family):
         ''' Construct the quotient MDP for the family. '''
         # select actions compatible with the family and restrict the quotient
-        choices = self.coloring.selectCompatibleChoices(family.family)
+        parent_info = family.parent_info
+        if parent_info is not None and parent_info.selected_choices is not None and parent_info.splitter is not None:
+            # only the splitter has changed: refine the selection of the parent
+            choices = self.coloring.selectCompatibleChoices(family.family, parent_info.selected_choices, parent_info.splitter)
+        else:
+            choices = self.coloring.selectCompatibleChoices(family.family)
         family.mdp = self.build_from_choice_mask(choices)
         family.selected_choices = choices
         family.mdp.family = family
@@ -263,9 +268,10 @@ class Quotient:
         ''' Distribute used options of a splitter into different suboptions. '''
         assert len(used_options) > 1
         suboptions = [[option] for option in used_options]
+        used_options_set = set(used_options)
         index = 0
         for option in mdp.family.hole_options(splitter):
-            if option in used_options:
+            if option in used_options_set:
                 continue
             suboptions[index].append(option)
             index = (index + 1) % len(suboptions)
@@ -274,7 +280,8 @@ class Quotient:
     def suboptions_enumerate(self, mdp, splitter, used_options):
         assert len(used_options) > 1
         core_suboptions = [[option] for option in used_options]
-        other_suboptions = [option for option in mdp.family.hole_options(splitter) if option not in used_options]
+        used_options_set = set(used_options)
+        other_suboptions = [option for option in mdp.family.hole_options(splitter) if option not in used_options_set]
         return core_suboptions, other_suboptions
 
     def holes_with_max_score(self, hole_score):
@@ -311,6 +318,7 @@ class Quotient:
 
         # construct corresponding subfamilies
         parent_info = family.collect_parent_info(self.specification)
+        parent_info.splitter = splitter
         subfamilies = family.split(splitter,suboptions)
         for subfamily in subfamilies:
             subfamily.add_parent_info(parent_info)
@@ -325,14 +333,11 @@ class Quotient:
     def identify_absorbing_states(cls, model):
         state_is_absorbing = [True] * model.nr_states
         tm = model.transition_matrix
+        nci = model.nondeterministic_choice_indices.copy()
         for state in range(model.nr_states):
-            for choice in tm.get_rows_for_group(state):
-                for entry in tm.get_row(choice):
-                    if entry.column != state:
-                        state_is_absorbing[state] = False
-                        break
-                if not state_is_absorbing[state]:
-                    break
+            state_is_absorbing[state] = all(
+                entry.column == state for choice in range(nci[state],nci[state+1]) for entry in tm.get_row(choice)
+            )
         return state_is_absorbing
 
     @classmethod
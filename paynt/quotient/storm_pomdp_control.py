@@ -25,7 +25,7 @@ class StormPOMDPControl:
     paynt_bounds = None
     paynt_export = []
 
-    # parsed best result data dictionary (Starting with data from Storm)
+    # parsed best result data dictionary (Starting with data from Storm), maps observations to sets of actions
     result_dict = {}
     result_dict_no_cutoffs = {}
     result_dict_paynt = {}
@@ -130,8 +130,7 @@ class StormPOMDPControl:
         elif self.storm_options == "overapp":
             options = self.get_overapp_options()
         else:
-            logger.error("Incorrect option setting for Storm was found")
-            exit()
+            raise ValueError(f"unknown Storm options {self.storm_options}")
 
         belmc = stormpy.pomdp.BeliefExplorationModelCheckerDouble(self.pomdp, options)
 
@@ -157,7 +156,8 @@ class StormPOMDPControl:
                 pass
             else:
                 print(f'FSC (dot) = {result.induced_mc_from_scheduler.to_dot()}\n', flush=True)
-            exit()
+            # one-shot mode: the result is only printed, the caller ends the run
+            return
 
         # print(f'\nFSC (dot) = {result.induced_mc_from_scheduler.to_dot()}\n', flush=True)
 
@@ -357,105 +357,127 @@ class StormPOMDPControl:
         return result
     
     # parse the current Storm and PAYNT results if they are available
+    # PAYNT result is parsed first since it is joined into the Storm result for finite-memory cut-offs
     def parse_results(self, quotient):
+        if self.latest_paynt_result is not None:
+            self.parse_paynt_result(quotient)
+        else:
+            self.result_dict_paynt = {}
+
         if self.latest_storm_result is not None:
             self.parse_storm_result(quotient)
         else:
             self.result_dict = {}
             self.result_dict_no_cutoffs = {}
 
-        if self.latest_paynt_result is not None:
-            self.parse_paynt_result(quotient)
-        else:
-            self.result_dict_paynt = {}    
-
     # parse Storm results into a dictionary
     def parse_storm_result(self, quotient):
-        # to make the code cleaner
-        get_choice_label = self.latest_storm_result.induced_mc_from_scheduler.choice_labeling.get_labels_of_choice
+        induced_mc = self.latest_storm_result.induced_mc_from_scheduler
+        labeling = induced_mc.labeling
+        choice_labeling = induced_mc.choice_labeling
 
         cutoff_epxloration = list(range(len(self.latest_storm_result.cutoff_schedulers)))
         finite_mem = False
 
-        result = {x:[] for x in range(quotient.observations)}
-        result_no_cutoffs = {x:[] for x in range(quotient.observations)}
-        
-        for state in self.latest_storm_result.induced_mc_from_scheduler.states:
-            # TODO what if there were no labels in the model?
-            if get_choice_label(state.id) == set():
+        result = {x:set() for x in range(quotient.observations)}
+        result_no_cutoffs = {x:set() for x in range(quotient.observations)}
+
+        # for each observation, map action labels to the indices of the corresponding actions
+        observation_action_label_to_index = []
+        for action_labels in quotient.action_labels_at_observation:
+            action_label_to_index = {}
+            for index,action_label in enumerate(action_labels):
+                action_label_to_index.setdefault(action_label,index)
+            observation_action_label_to_index.append(action_label_to_index)
+
+        # the induced MC has a single choice in each state: collect the choice labels per label rather than per state
+        # TODO what if there were no labels in the model?
+        state_choice_label = [None] * induced_mc.nr_states
+        for choice_label in choice_labeling.get_labels():
+            for state in choice_labeling.get_choices(choice_label):
+                # keep the first label of a state with several choice labels
+                if state_choice_label[state] is None:
+                    state_choice_label[state] = choice_label
+
+        def states_with_label(label):
+            if not labeling.contains_label(label):
+                return stormpy.storage.BitVector(induced_mc.nr_states, False)
+            return labeling.get_states(label)
+        cutoff_states = states_with_label('cutoff') | states_with_label('clipping')
+        finite_mem_states = states_with_label('finite_mem')
+        # observation of each POMDP state, retrieved once the first cut-off scheduler is parsed
+        pomdp_state_observations = None
+
+        # parse non cut-off states, traversing the states of each observation label
+        for label in labeling.get_labels():
+            observation = None
+            if '[' in label:
+                # observation based on prism observables
+                observation = self.quotient.observation_label_to_observation[label]
+            elif 'obs_' in label:
+                # explicit observation index
+                _,observation = label.split('_')
+            if observation is None:
+                continue
+            observation = int(observation)
+            action_label_to_index = observation_action_label_to_index[observation]
+            for state in labeling.get_states(label):
+                choice_label = state_choice_label[state]
+                if choice_label is None or cutoff_states.get(state):
+                    continue
+                index = action_label_to_index.get(choice_label)
+                if index is not None:
+                    result[observation].add(index)
+                    result_no_cutoffs[observation].add(index)
+
+        # parse cut-off states
+        for state in cutoff_states:
+            choice_label = state_choice_label[state]
+            if choice_label is None:
                 continue
 
-            # parse non cut-off states
-            if 'cutoff' not in state.labels and 'clipping' not in state.labels:
-                for label in state.labels:
-                    observation = None
-                    if '[' in label:
-                        # observation based on prism observables
-                        observation = self.quotient.observation_labels.index(label)
-                    elif 'obs_' in label:
-                        # explicit observation index
-                        _,observation = label.split('_')
-                    if observation is not None:
-                        observation = int(observation)
-                        choice_label = list(get_choice_label(state.id))[0]
-                        for index,action_label in enumerate(quotient.action_labels_at_observation[observation]):
-                            if choice_label == action_label:
-                                if index not in result[observation]:
-                                    result[observation].append(index)
-                                if index not in result_no_cutoffs[observation]:
-                                    result_no_cutoffs[observation].append(index)
-                                break
-                        
-
-            # parse cut-off states
+            if finite_mem_states.get(state) and not finite_mem:
+                finite_mem = True
+                for obs,actions in self.result_dict_paynt.items():
+                    result_no_cutoffs[obs].update(actions)
+                    result[obs].update(actions)
             else:
-                if 'finite_mem' in state.labels and not finite_mem:
-                    finite_mem = True
-                    self.parse_paynt_result(self.quotient)
-                    for obs,actions in self.result_dict_paynt.items():
-                        for action in actions:
-                            if action not in result_no_cutoffs[obs]:
-                                result_no_cutoffs[obs].append(action)
-                            if action not in result[obs]:
-                                result[obs].append(action)
-                else:
-                    if len(cutoff_epxloration) == 0:
+                if len(cutoff_epxloration) == 0:
+                    continue
+
+                # obtain what cut-off scheduler was used
+                if 'sched_' in choice_label:
+                    _, scheduler_index = choice_label.split('_')
+
+                    if int(scheduler_index) not in cutoff_epxloration:
                         continue
-                    
-                    # obtain what cut-off scheduler was used
-                    if 'sched_' in list(get_choice_label(state.id))[0]:
-                        _, scheduler_index = list(get_choice_label(state.id))[0].split('_')
-    
-                        if int(scheduler_index) not in cutoff_epxloration:
-                            continue
-    
-                        scheduler = self.latest_storm_result.cutoff_schedulers[int(scheduler_index)]
-    
-                        for state in range(quotient.pomdp.nr_states):
-    
-                            choice_string = str(scheduler.get_choice(state).get_choice())
-                            actions = self.parse_choice_string(choice_string)
-    
-                            observation = quotient.pomdp.get_observation(state)
-    
-                            for action in actions:
-                                if action not in result[observation]:
-                                    result[observation].append(action)
-                        cutoff_epxloration.remove(int(scheduler_index))
 
-        # removing unrestricted observations
-        observations = list(result.keys())
-        for obs in observations:
-            if len(result[obs]) == 0:
-                del result[obs]
+                    scheduler = self.latest_storm_result.cutoff_schedulers[int(scheduler_index)]
+                    if pomdp_state_observations is None:
+                        pomdp_state_observations = quotient.pomdp.observations.copy()
+
+                    for pomdp_state in range(quotient.pomdp.nr_states):
+
+                        actions = self.get_scheduler_choice_actions(scheduler, pomdp_state)
 
-            if len(result_no_cutoffs[obs]) == 0:
-                del result_no_cutoffs[obs]
+                        observation = pomdp_state_observations[pomdp_state]
 
-        self.result_dict = result    
-        self.result_dict_no_cutoffs = result_no_cutoffs       
+                        result[observation].update(actions)
+                    cutoff_epxloration.remove(int(scheduler_index))
+
+        # removing unrestricted observations
+        self.result_dict = {obs:actions for obs,actions in result.items() if len(actions) > 0}
+        self.result_dict_no_cutoffs = {obs:actions for obs,actions in result_no_cutoffs.items() if len(actions) > 0}
             
 
+    # help function for cut-off parsing, returns list of actions chosen by the scheduler in the given state
+    # stormpy exposes distributions only via their string representation, so only randomized choices are parsed
+    def get_scheduler_choice_actions(self, scheduler, state):
+        choice = scheduler.get_choice(state)
+        if choice.deterministic:
+            return [choice.get_deterministic_choice()]
+        return self.parse_choice_string(str(choice.get_choice()))
+
     # help function for cut-off parsing, returns list of actions for given choice_string
     # TODO bound to restrict some action if needed
     def parse_choice_string(self, choice_string, probability_bound=0):
@@ -477,7 +499,7 @@ class StormPOMDPControl:
     # parse PAYNT result to a dictionart
     def parse_paynt_result(self, quotient):
 
-        result = {x:[] for x in range(quotient.observations)}
+        result = {x:set() for x in range(quotient.observations)}
         
         for hole in range(self.latest_paynt_result.num_holes):
             name = self.latest_paynt_result.hole_name(hole)
@@ -485,19 +507,13 @@ class StormPOMDPControl:
                 continue
             name = name.strip('A()')
             obs = name.split(',')[0]
-            observation = self.quotient.observation_labels.index(obs)
+            observation = self.quotient.observation_label_to_observation[obs]
 
             option = self.latest_paynt_result.hole_options(hole)[0]
-            if option not in result[observation]:
-                result[observation].append(option)
-
-        observations = list(result.keys())
-        for obs in observations:
-            if len(result[obs]) == 0:
-                del result[obs]
+            result[observation].add(option)
 
         #logger.info("Result dictionary is based on result from PAYNT")
-        self.result_dict_paynt = result
+        self.result_dict_paynt = {obs:actions for obs,actions in result.items() if len(actions) > 0}
 
     # returns the main family that will be explored first
     # main family contains only the actions considered by respective FSC (most usually Storm result)
@@ -509,12 +525,15 @@ class StormPOMDPControl:
         restricted_family = family.copy()
         # go through each observation of interest
         for obs in range(self.quotient.observations):
+            # actions considered by the FSC in this observation, None if the observation is not restricted
+            obs_actions = result_dict.get(obs)
             for hole in self.quotient.observation_action_holes[obs]:
 
-                if obs in result_dict.keys():
-                    selected_actions = [action for action in family.hole_options(hole) if action in result_dict[obs]]
+                hole_options = family.hole_options(hole)
+                if obs_actions is not None:
+                    selected_actions = [action for action in hole_options if action in obs_actions]
                 else:
-                    selected_actions = [family.hole_options(hole)[0]]
+                    selected_actions = hole_options[:1]
 
                 if len(selected_actions) == 0:
                     return None
@@ -536,28 +555,20 @@ class StormPOMDPControl:
 
         subfamilies_restriction = []
 
-        restricted_holes_list = []
-
-        for observ in result_dict.keys():
-
-            act_obs_holes = self.quotient.observation_action_holes[observ]
-            restricted_holes_list.extend(act_obs_holes)
-
-        for hole in restricted_holes_list:
-
-            for obs_holes, index in zip(self.quotient.observation_action_holes, range(len(self.quotient.observation_action_holes))):
-                if hole in obs_holes:
-                    obs = index
+        # action holes of each restricted observation, so no reverse lookup of the observation of a hole is needed
+        for obs in result_dict.keys():
 
             if len(result_dict[obs]) == self.quotient.actions_at_observation[obs]:
                 continue
 
-            restriction = [action for action in family.hole_options(hole) if action in result_dict[obs]]
+            for hole in self.quotient.observation_action_holes[obs]:
 
-            if len(restriction) == family.hole_num_options(hole):
-                continue
+                restriction = [action for action in family.hole_options(hole) if action in result_dict[obs]]
 
-            subfamilies_restriction.append({"hole": hole, "restriction": restriction})
+                if len(restriction) == family.hole_num_options(hole):
+                    continue
+
+                subfamilies_restriction.append({"hole": hole, "restriction": restriction})
 
         return subfamilies_restriction
 
@@ -566,20 +577,22 @@ class StormPOMDPControl:
 
         subfamilies = []
 
-        for i,restriction in enumerate(restrictions):
-            restricted_family = family.copy()
-
-            actions = [action for action in family.hole_options(restriction["hole"]) if action not in restriction["restriction"]]
+        # i-th subfamily is the family restricted by the first i-1 restrictions, where the i-th hole takes the
+        # remaining options; the prefix of restrictions is shared and applied incrementally
+        prefix_family = family.copy()
+        for restriction in restrictions:
+            hole = restriction["hole"]
+            hole_options = family.hole_options(hole)
+            actions = [action for action in hole_options if action not in restriction["restriction"]]
             if len(actions) == 0:
-                actions = [family.hole_options(restriction["hole"])[0]]
-
-            restricted_family.hole_set_options(restriction['hole'],actions)
-
-            for j in range(i):
-                restricted_family.hole_set_options(restrictions[j]['hole'],restrictions[j]["restriction"])
+                actions = hole_options[:1]
 
+            restricted_family = prefix_family.copy()
+            restricted_family.hole_set_options(hole,actions)
             subfamilies.append(restricted_family)
 
+            prefix_family.hole_set_options(hole,restriction["restriction"])
+
         return subfamilies
 
     # returns True if the current best FSC from Storm requires more memory
@@ -666,16 +679,14 @@ class StormPOMDPControl:
             if paynt_fsc_size:
                 fsc_size = paynt_fsc_size
 
+        pomdp_state_observations = self.quotient.pomdp.observations.copy() if used_randomized_schedulers else None
         for index in used_randomized_schedulers:
-            observation_actions = {x:[] for x in range(self.quotient.observations)}
+            observation_actions = {x:set() for x in range(self.quotient.observations)}
             rand_scheduler = storm_result.cutoff_schedulers[index]
             for state in range(self.quotient.pomdp.nr_states):
-                choice_string = str(rand_scheduler.get_choice(state).get_choice())
-                actions = self.parse_choice_string(choice_string)
-                observation = self.quotient.pomdp.get_observation(state)
-                for action in actions:
-                    if action not in observation_actions[observation]:
-                        observation_actions[observation].append(action)
+                actions = self.get_scheduler_choice_actions(rand_scheduler, state)
+                observation = pomdp_state_observations[state]
+                observation_actions[observation].update(actions)
             randomized_schedulers_size += sum(list([len(support) for support in observation_actions.values()])) * 3
 
         result_size = non_frontier_states + belief_mc.nr_transitions + fsc_size + randomized_schedulers_size
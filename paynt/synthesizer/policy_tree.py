@@ -638,7 +638,7 @@ class SynthesizerPolicyTree(paynt.synthesizer.synthesizer.Synthesizer):
             return
         option = used_options[0]
         for subfamily in subfamilies:
-            if option in subfamily.hole_options(splitter):
+            if subfamily.hole_contains(splitter,option):
                 subfamily.candidate_policy = policy
                 return
 
@@ -648,7 +648,8 @@ class SynthesizerPolicyTree(paynt.synthesizer.synthesizer.Synthesizer):
         if len(used_options) > 1:
             # used_options = used_options[0:1]
             core_suboptions = [[option] for option in used_options]
-            other_suboptions = [option for option in family.hole_options(splitter) if option not in used_options]
+            used_options_set = set(used_options)
+            other_suboptions = [option for option in family.hole_options(splitter) if option not in used_options_set]
             if other_suboptions:
                 other_suboptions = [other_suboptions]
             else:
@@ -3,11 +3,40 @@ import paynt.synthesizer.synthesizer
 import paynt.quotient.pomdp
 import paynt.verification.property_result
 
+import heapq
+import math
+
 import logging
 logger = logging.getLogger(__name__)
 
+class FamilyWorklist:
+    '''
+    Worklist of families to be explored: families with lower priority are popped first, families sharing the same
+    priority are popped in the reverse order of pushing (depth-first).
+    '''
+
+    def __init__(self):
+        # heap of (priority, -insertion index, family)
+        self.heap = []
+        self.num_pushed = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, family, priority=0):
+        heapq.heappush(self.heap, (priority,-self.num_pushed,family))
+        self.num_pushed += 1
+
+    def pop(self):
+        _,_,family = heapq.heappop(self.heap)
+        return family
+
+
 class SynthesizerAR(paynt.synthesizer.synthesizer.Synthesizer):
 
+    # if True, subfamilies of undecided families with the most promising bound are explored first; depth-first otherwise
+    exploration_order_best_first = False
+
     @property
     def method_name(self):
         return "AR"
@@ -33,7 +62,7 @@ class SynthesizerAR(paynt.synthesizer.synthesizer.Synthesizer):
             results[index] = result
 
             # check primary direction
-            result.primary = model.model_check_property(constraint)
+            result.primary = model.model_check_property(constraint, abstraction=True)
             if result.primary.sat is False:
                 result.sat = False
                 break
@@ -49,7 +78,7 @@ class SynthesizerAR(paynt.synthesizer.synthesizer.Synthesizer):
                     admissible_assignment = assignment
 
             # primary direction is SAT: check secondary direction to see whether all SAT
-            result.secondary = model.model_check_property(constraint, alt=True)
+            result.secondary = model.model_check_property(constraint, alt=True, abstraction=True)
             if mdp.is_deterministic and result.primary.value != result.secondary.value:
                 logger.warning("WARNING: model is deterministic but min<max")
             if result.secondary.sat:
@@ -65,7 +94,7 @@ class SynthesizerAR(paynt.synthesizer.synthesizer.Synthesizer):
             result = paynt.verification.property_result.MdpOptimalityResult(opt)
 
             # check primary direction
-            result.primary = model.model_check_property(opt)
+            result.primary = model.model_check_property(opt, abstraction=True)
             if not result.primary.improves_optimum:
                 # OPT <= LB
                 result.can_improve = False
@@ -115,12 +144,26 @@ class SynthesizerAR(paynt.synthesizer.synthesizer.Synthesizer):
         if isinstance(self.quotient, paynt.quotient.pomdp.PomdpQuotient):
             self.stat.new_fsc_found(family.analysis_result.improving_value, ia, self.quotient.policy_size(ia))
 
+    def split_priority(self, family):
+        '''
+        :return priority of subfamilies of an undecided family (lower is explored first): families whose parent
+            bound on the optimality property is the most promising are explored first, families without such a bound
+            are explored last; all families have the same priority when exploring depth-first
+        '''
+        if not SynthesizerAR.exploration_order_best_first:
+            return 0
+        opt = family.analysis_result.optimality_result
+        if opt is None or opt.primary is None:
+            return math.inf
+        return opt.primary.value if opt.minimizing else -opt.primary.value
+
     def synthesize_one(self, family):
-        families = [family]
+        families = FamilyWorklist()
+        families.push(family)
         while families:
             if self.resource_limit_reached():
                 break
-            family = families.pop(-1)
+            family = families.pop()
             self.verify_family(family)
             self.update_optimum(family)
             if not self.quotient.specification.has_optimality and self.best_assignment is not None:
@@ -131,5 +174,7 @@ class SynthesizerAR(paynt.synthesizer.synthesizer.Synthesizer):
                 continue
             # undecided
             subfamilies = self.quotient.split(family)
-            families = families + subfamilies
+            priority = self.split_priority(family)
+            for subfamily in subfamilies:
+                families.push(subfamily, priority)
         return self.best_assignment
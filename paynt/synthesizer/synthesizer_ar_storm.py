@@ -3,6 +3,8 @@ import paynt.synthesizer.synthesizer_ar
 from ..quotient.storm_pomdp_control import StormPOMDPControl
 from os import makedirs
 
+import collections
+
 
 from time import sleep
 
@@ -110,7 +112,7 @@ class SynthesizerARStorm(paynt.synthesizer.synthesizer_ar.SynthesizerAR):
         if self.main_family is not None:
             family = self.main_family
 
-        families = [family]
+        families = collections.deque([family])
 
         while families:
 
@@ -141,7 +143,8 @@ class SynthesizerARStorm(paynt.synthesizer.synthesizer_ar.SynthesizerAR):
                                 return self.best_assignment
                             else:
                                 logger.info("Applying family split according to Storm results")
-                                families, self.subfamilies_buffer = self.storm_split(families)
+                                main_families, self.subfamilies_buffer = self.storm_split(families)
+                                families = collections.deque(main_families)
                         # if Storm's result is not better continue with the synthesis normally
                         else:
                             logger.info("PAYNT's value is better. Prioritizing synthesis results")
@@ -152,9 +155,9 @@ class SynthesizerARStorm(paynt.synthesizer.synthesizer_ar.SynthesizerAR):
                         return self.best_assignment
 
             if SynthesizerARStorm.exploration_order_dfs:
-                family = families.pop(-1)
+                family = families.pop()
             else:
-                family = families.pop(0)
+                family = families.popleft()
 
             # simulate sequential
             family.parent_info = None
@@ -169,13 +172,13 @@ class SynthesizerARStorm(paynt.synthesizer.synthesizer_ar.SynthesizerAR):
                 if not families and self.subfamilies_buffer:
                     logger.info("Main family synthesis done")
                     logger.info(f"Subfamilies buffer contains: {len(self.subfamilies_buffer)} families")
-                    families = self.subfamilies_buffer
+                    families = collections.deque(self.subfamilies_buffer)
                     self.subfamilies_buffer = []
                 continue
 
             # undecided
             subfamilies = self.quotient.split(family)
-            families = families + subfamilies
+            families.extend(subfamilies)
 
         return self.best_assignment
 
@@ -93,7 +93,8 @@ class SynthesizerCEGIS(paynt.synthesizer.synthesizer.Synthesizer):
 
         # use sketch design space as a SAT baseline (TODO why?)
         smt_solver = paynt.family.smt.SmtSolver(self.quotient.family)
-        
+        smt_solver.assert_family(family)
+
         # CEGIS loop
         assignment = smt_solver.pick_assignment(family)
         while assignment is not None:
@@ -5,6 +5,8 @@ import paynt.synthesizer.synthesizer_cegis
 import paynt.family.smt
 import paynt.utils.timer
 
+import collections
+
 import logging
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,7 @@ class StageControl:
         self.timer_cegis = paynt.utils.timer.Timer()
 
         self.family_size = family_size
+        # number of members pruned by each method (exact integers: only their ratio is of interest)
         self.pruned_ar = 0
         self.pruned_cegis = 0
         
@@ -45,10 +48,10 @@ class StageControl:
         self.timer_cegis.start()
 
     def prune_ar(self, pruned):
-        self.pruned_ar += pruned / self.family_size
+        self.pruned_ar += pruned
 
     def prune_cegis(self, pruned):
-        self.pruned_cegis += pruned / self.family_size
+        self.pruned_cegis += pruned
 
     def cegis_has_time(self):
         """
@@ -78,9 +81,9 @@ class StageControl:
             elif self.pruned_ar > 0 and self.pruned_cegis == 0:
                 self.cegis_efficiency = 0.5
             else:
-                success_rate_cegis = self.pruned_cegis / self.timer_cegis.read()
-                success_rate_ar = self.pruned_ar / self.timer_ar.read()
-                self.cegis_efficiency = success_rate_cegis / success_rate_ar
+                # ratio of success rates (pruned/time), the pruned counts are divided first since they may be
+                # too large to be converted to floats
+                self.cegis_efficiency = self.pruned_cegis / self.pruned_ar * self.timer_ar.read() / self.timer_cegis.read()
         
         return False
 
@@ -97,7 +100,7 @@ class SynthesizerHybrid(paynt.synthesizer.synthesizer_ar.SynthesizerAR, paynt.sy
         smt_solver = paynt.family.smt.SmtSolver(self.quotient.family)
 
         # AR-CEGIS loop
-        families = [family]
+        families = collections.deque([family])
         self.stage_control = StageControl(family.size)
         while families:
 
@@ -105,7 +108,7 @@ class SynthesizerHybrid(paynt.synthesizer.synthesizer_ar.SynthesizerAR, paynt.sy
             self.stage_control.start_ar()
             
             # choose family
-            family = families.pop(-1)
+            family = families.pop()
 
             # reset SMT solver level
             smt_solver.level(family.refinement_depth)
@@ -128,6 +131,9 @@ class SynthesizerHybrid(paynt.synthesizer.synthesizer_ar.SynthesizerAR, paynt.sy
                 result = family.analysis_result.constraints_result.results[0]
             priority_subfamily = family.assume_options_copy(result.primary_selection)
 
+            # restrict the solver scope of this refinement level to the family
+            smt_solver.assert_family(family)
+
             # explore family assignments
             family_explored = False
             while True:
@@ -135,7 +141,6 @@ class SynthesizerHybrid(paynt.synthesizer.synthesizer_ar.SynthesizerAR, paynt.sy
                 if not self.stage_control.cegis_has_time():
                     break   # CEGIS timeout
 
-                family.encode(smt_solver)
                 # assignment = smt_solver.pick_assignment(family)
                 assignment = smt_solver.pick_assignment_priority(family, priority_subfamily)
                 if assignment is None:
@@ -158,6 +163,6 @@ class SynthesizerHybrid(paynt.synthesizer.synthesizer_ar.SynthesizerAR, paynt.sy
                 continue
         
             subfamilies = self.quotient.split(family)
-            families = families + subfamilies
+            families.extend(subfamilies)
 
         return self.best_assignment
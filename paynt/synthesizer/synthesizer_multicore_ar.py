@@ -3,7 +3,9 @@ from paynt.synthesizer.synthesizer_ar import SynthesizerAR
 
 import os
 import time
+import collections
 import multiprocessing
+import concurrent.futures
 
 import logging
 logger = logging.getLogger(__name__)
@@ -14,6 +16,7 @@ import cProfile, pstats
 # global variables
 # when a new process is spawned (forked), it will inherit these variables from the parent
 quotient = None
+synthesizer = None
 profiler = None
 
 # helper functions for family serialization
@@ -46,7 +49,7 @@ def solve_family(args):
             quotient.specification.optimality.optimum = optimum
 
         quotient.build(family)
-        quotient.check_specification_for_mdp(family)
+        synthesizer.check_specification(family)
         res = family.analysis_result
         improving_value = res.improving_value
         improving_assignment = res.improving_assignment
@@ -62,7 +65,7 @@ def solve_family(args):
 
     except:
         logger.error("Worker sub-process encountered an error.")
-        return None
+        raise
 
 
 
@@ -72,73 +75,93 @@ class SynthesizerMultiCoreAR(SynthesizerAR):
     def method_name(self):
         return "AR (multicore)"
 
+    def update_optimum_from_worker(self, improving_value, improving_assignment):
+        if improving_assignment is None:
+            return
+        if not self.quotient.specification.has_optimality:
+            self.best_assignment = hole_options_to_family(improving_assignment)
+            return
+        # the worker might have used an outdated optimum: double-check the improvement
+        if not self.quotient.specification.optimality.improves_optimum(improving_value):
+            return
+        self.quotient.specification.optimality.update_optimum(improving_value)
+        self.best_assignment = hole_options_to_family(improving_assignment)
+        self.best_assignment_value = improving_value
+
+    @staticmethod
+    def shutdown_executor(executor, terminate):
+        '''
+        Shut down the pool of workers.
+        :param terminate if True, families still being analyzed are abandoned: the workers are terminated instead of
+            waiting for them to finish their current family
+        '''
+        if not terminate:
+            executor.shutdown(wait=True)
+            return
+        # the executor does not expose its workers: collect them before the shutdown forgets them
+        processes = list(executor._processes.values()) if executor._processes is not None else []
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join()
+
     def synthesize_one(self, family):
 
-        satisfying_assignment = None
-        families = [family]
+        families = collections.deque([family])
 
-        global quotient
+        global quotient, synthesizer
         quotient = self.quotient
+        synthesizer = self
         profiling = False
         if profiling:
             global profiler
             profiler = cProfile.Profile()
             profiler.enable()
 
-        # create a pool of processes
-        # by default, os.cpu_count() processes will be spawned
-        with multiprocessing.Pool(
-            # processes=1
-        ) as pool:
+        # create a pool of (forked) processes, each analyzing one family at a time; a new family is submitted as soon
+        # as some worker becomes idle so that a single expensive family does not stall the remaining workers
+        num_workers = os.cpu_count()
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=num_workers, mp_context=multiprocessing.get_context("fork")
+        )
 
-            while families:
+        # families being analyzed, mapped to their sizes
+        pending = {}
+        try:
+            while families or pending:
+                if self.resource_limit_reached():
+                    break
 
                 # get current optimum
                 optimum = None
                 if self.quotient.specification.has_optimality:
                     optimum = self.quotient.specification.optimality.optimum
 
-                # work with some number of families
-                # print("submitting ", len(families), " families")
+                while families and len(pending) < num_workers:
+                    family = families.pop()
+                    future = executor.submit(solve_family, (family_to_hole_options(family), optimum))
+                    pending[future] = family.size
 
-                split = os.cpu_count() * 1
-                input_families = families[-split:]
-                input_families_size = sum([family.size for family in input_families])
-                remaining_families = families[:-split]
-                input_families = [family_to_hole_options(family) for family in input_families]
-
-                inputs = zip(input_families, [optimum] * len(input_families))
-
-                results = pool.map(solve_family, inputs)
-                # results = pool.imap_unordered(solve_family, inputs, chunksize=10)
-                # results = pool.map(solve_batch, inputs)
-
-                # process the results
-                new_families = []
-                for r in results:
-                    if r is None:
-                        logger.error("Worker sub-process encountered an error.")
-                        exit()
-                    mdp_states, improving_value, improving_assignment, subfamilies_hole_options = r
+                done,_ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    family_size = pending.pop(future)
+                    mdp_states, improving_value, improving_assignment, subfamilies_hole_options = future.result()
                     self.stat.iteration_mdp(mdp_states)
-
-                    if improving_value is not None:
-                        if self.quotient.specification.optimality.improves_optimum(improving_value):
-                            self.quotient.specification.optimality.update_optimum(improving_value)
-                            improving_assignment = hole_options_to_family(improving_assignment)
-                            satisfying_assignment = improving_assignment
+                    self.update_optimum_from_worker(improving_value, improving_assignment)
 
                     subfamilies = [hole_options_to_family(hole_options) for hole_options in subfamilies_hole_options]
-                    new_families += subfamilies
-
-                new_families_size = sum([family.size for family in new_families])
-                self.explored += input_families_size-new_families_size
+                    self.explored += family_size - sum([subfamily.size for subfamily in subfamilies])
+                    families.extend(subfamilies)
 
-                families = remaining_families + new_families
+                if not self.quotient.specification.has_optimality and self.best_assignment is not None:
+                    break
 
-            if profiling:
-                pool.apply(solve_family, (None,))
+            if profiling and not pending:
+                executor.submit(solve_family, None).result()
+        finally:
+            SynthesizerMultiCoreAR.shutdown_executor(executor, terminate=len(pending) > 0)
 
         if profiling:
             pstats.Stats(profiler).sort_stats('tottime').print_stats(10)
-        return satisfying_assignment
+        return self.best_assignment
@@ -9,11 +9,28 @@ class SynthesizerOneByOne(paynt.synthesizer.synthesizer.Synthesizer):
     def method_name(self):
         return "1-by-1"
 
+    def all_assignments(self, family):
+        '''
+        Enumerate all members of the family. Consecutive combinations mostly differ in the last few holes, so a single
+        assignment is updated in place.
+        @note the yielded assignment must be copied if it is to be kept
+        '''
+        assignment = None
+        previous_combination = None
+        for hole_combination in family.all_combinations():
+            if assignment is None:
+                assignment = family.construct_assignment(hole_combination)
+            else:
+                for hole,option in enumerate(hole_combination):
+                    if option != previous_combination[hole]:
+                        assignment.hole_set_options(hole,[option])
+            previous_combination = hole_combination
+            yield assignment
+
     def synthesize_one(self, family):
         
-        for hole_combination in family.all_combinations():
+        for assignment in self.all_assignments(family):
             
-            assignment = family.construct_assignment(hole_combination)
             dtmc = self.quotient.build_assignment(assignment)
             self.stat.iteration(dtmc)
             result = dtmc.check_specification(self.quotient.specification, short_evaluation=True)
@@ -21,11 +38,11 @@ class SynthesizerOneByOne(paynt.synthesizer.synthesizer.Synthesizer):
 
             accepting,improving_value = result.accepting_dtmc(self.quotient.specification)
             if accepting:
-                self.best_assignment = assignment
+                self.best_assignment = assignment.copy()
             if improving_value is not None:
                 self.quotient.specification.optimality.update_optimum(improving_value)
-            if accepting and not self.quotient.specification.can_be_improved:
-                return accepting_assignment
+            if accepting and not self.quotient.specification.can_be_improved():
+                return self.best_assignment
 
         return self.best_assignment
 
@@ -36,8 +53,7 @@ class SynthesizerOneByOne(paynt.synthesizer.synthesizer.Synthesizer):
             keep_value_only = True
 
         evaluations = []
-        for hole_combination in family.all_combinations():
-            assignment = family.construct_assignment(hole_combination)
+        for assignment in self.all_assignments(family):
             model = self.quotient.build_assignment(assignment)
             self.stat.iteration(model)
             result = model.model_check_property(prop)
@@ -47,7 +63,7 @@ class SynthesizerOneByOne(paynt.synthesizer.synthesizer.Synthesizer):
                 policy = None
                 if result.sat:
                     policy = self.quotient.scheduler_to_policy(result.result.scheduler, model)
-                evaluation = paynt.synthesizer.synthesizer.FamilyEvaluation(assignment, result.value, result.sat, policy)
+                evaluation = paynt.synthesizer.synthesizer.FamilyEvaluation(assignment.copy(), result.value, result.sat, policy)
             evaluations.append(evaluation)
             self.explore(assignment)
         return evaluations
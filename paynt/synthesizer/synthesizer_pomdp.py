@@ -298,6 +298,8 @@ class SynthesizerPomdp:
             if self.storm_control.get_result:
                 self.run_synthesis_timeout(self.storm_control.get_result)
             self.storm_control.run_storm_analysis()
+            # one-shot mode: the Storm result was printed by the analysis, the run ends here
+            return
         # run Storm and then use the obtained result to enhance PAYNT synthesis
         else:
             self.storm_control.get_storm_result()
@@ -2,6 +2,7 @@ import stormpy
 import payntbind
 import math
 import operator
+import re
 
 import logging
 logger = logging.getLogger(__name__)
@@ -59,19 +60,32 @@ class Property:
     environment = None
     # model checking precision
     model_checking_precision = 1e-4
+    # model checking environment for abstractions (MDPs), None if the default environment is used
+    environment_abstraction = None
+    # model checking precision for abstractions, None if model_checking_precision is used
+    abstraction_precision = None
 
     @classmethod
     def set_model_checking_precision(cls, precision):
+        ''' Set the precision of the default environment, the environment for abstractions is left unchanged. '''
         cls.model_checking_precision = precision
         payntbind.synthesis.set_precision_native(cls.environment.solver_environment.native_solver_environment, precision)
         payntbind.synthesis.set_precision_minmax(cls.environment.solver_environment.minmax_solver_environment, precision)
 
     @classmethod
     def initialize(cls, use_exact=False):
-        cls.environment = stormpy.Environment()
-        cls.set_model_checking_precision(cls.model_checking_precision)
+        cls.environment = cls.create_environment(cls.model_checking_precision, use_exact)
+        cls.environment_abstraction = None
+        if cls.abstraction_precision is not None:
+            cls.environment_abstraction = cls.create_environment(cls.abstraction_precision, use_exact)
+
+    @classmethod
+    def create_environment(cls, precision, use_exact=False):
+        environment = stormpy.Environment()
+        se = environment.solver_environment
+        payntbind.synthesis.set_precision_native(se.native_solver_environment, precision)
+        payntbind.synthesis.set_precision_minmax(se.minmax_solver_environment, precision)
 
-        se = cls.environment.solver_environment
         # se.set_linear_equation_solver_type(stormpy.EquationSolverType.native)
         # se.set_linear_equation_solver_type(stormpy.EquationSolverType.gmmxx)
         se.set_linear_equation_solver_type(stormpy.EquationSolverType.eigen)
@@ -80,10 +94,22 @@ class Property:
             se.minmax_solver_environment.method = stormpy.MinMaxMethod.policy_iteration
         else:
             se.minmax_solver_environment.method = stormpy.MinMaxMethod.optimistic_value_iteration
+        return environment
 
     @classmethod
-    def model_check(cls, model, formula):
-        return stormpy.model_checking(model, formula, extract_scheduler=True, environment=cls.environment)
+    def model_check(cls, model, formula, abstraction=False):
+        '''
+        :param abstraction if True and a separate precision for abstractions was set, the model will be checked
+            using this precision
+        '''
+        environment = cls.get_environment(abstraction)
+        return stormpy.model_checking(model, formula, extract_scheduler=True, environment=environment)
+
+    @classmethod
+    def get_environment(cls, abstraction=False):
+        if abstraction and cls.environment_abstraction is not None:
+            return cls.environment_abstraction
+        return cls.environment
 
     @classmethod
     def compute_expected_visits(cls, model):
@@ -137,6 +163,7 @@ class Property:
         else:
             self.formula.set_optimality_type(stormpy.OptimizationDirection.Maximize)
         self.formula_alt = Property.alt_formula(self.formula)
+        self.dtmc_formula_key = Property.formula_key_dtmc(self.formula)
 
     @staticmethod
     def alt_formula(formula):
@@ -152,6 +179,27 @@ class Property:
         formula_alt.set_optimality_type(optimality_type)
         return formula_alt
 
+    @staticmethod
+    def formula_key_dtmc(formula):
+        '''
+        :return key identifying the value of the (quantitative) formula on a DTMC, where the optimization direction
+            is irrelevant
+        '''
+        reward_name = formula.reward_name if formula.is_reward_operator else None
+        return (Property.formula_operator(formula), reward_name, str(formula.subformula))
+
+    @staticmethod
+    def formula_operator(formula):
+        '''
+        :return symbol of the operator of the formula: P (probability), R (reward), T (time) or LRA (long-run average)
+        '''
+        if formula.is_probability_operator:
+            return "P"
+        if formula.is_reward_operator:
+            return "R"
+        # other operators are only distinguished by their symbol
+        return re.match(r"[A-Z]+", str(formula)).group()
+
     def __str__(self):
         return str(self.property.raw_formula)
 
@@ -272,6 +320,7 @@ class OptimalityProperty(Property):
         # construct quantitative formula (without bound) for explicit model checking
         self.formula = rf.clone()
         self.formula_alt = Property.alt_formula(self.formula)
+        self.dtmc_formula_key = Property.formula_key_dtmc(self.formula)
 
         # additional optimality stuff
         self.optimum = None
@@ -132,11 +132,12 @@ namespace synthesis {
         this->hole_wave.resize(this->hole_count,0);
         
         // Associate states of a DTMC with relevant holes and store their count
-        std::vector<std::set<uint64_t>> dtmc_holes(dtmc_states);
+        // (the hole sets are shared with the quotient states rather than copied for each DTMC)
+        std::vector<std::set<uint64_t> const*> dtmc_holes(dtmc_states);
         std::vector<uint64_t> unregistered_holes_count(dtmc_states, 0);
         for(StateType state = 0; state < dtmc_states; state++) {
-            dtmc_holes[state] = this->mdp_holes[state_map[state]];
-            unregistered_holes_count[state] = dtmc_holes[state].size();
+            dtmc_holes[state] = &this->mdp_holes[state_map[state]];
+            unregistered_holes_count[state] = dtmc_holes[state]->size();
         }
 
         // Prepare to explore
@@ -209,7 +210,7 @@ namespace synthesis {
             blocking_candidate_set = false;
             
             // Register all unregistered holes of this blocking state
-            for(uint64_t hole: dtmc_holes[blocking_candidate]) {
+            for(uint64_t hole: *dtmc_holes[blocking_candidate]) {
                 if(this->hole_wave[hole] == 0) {
                     hole_wave[hole] = current_wave;
                     // std::cout << "[storm] hole " << hole << " expanded in wave " << current_wave << std::endl;
@@ -219,7 +220,7 @@ namespace synthesis {
             // Recompute number of unregistered holes in each state
             for(StateType state = 0; state < dtmc_states; state++) {
                 unregistered_holes_count[state] = 0;
-                for(uint64_t hole: dtmc_holes[state]) {
+                for(uint64_t hole: *dtmc_holes[state]) {
                     if(this->hole_wave[hole] == 0) {
                         unregistered_holes_count[state]++;
                     }
@@ -281,15 +282,17 @@ namespace synthesis {
         labeling_subdtmc.addLabelToState(this->target_label, sink_state_true);
 
         // Map MDP bounds onto the state space of a quotient MDP
+        // (the mapping is reused for consecutive conflicts constructed with the same bounds)
         bool have_bounds = mdp_bounds != NULL;
-        std::vector<ValueType> quotient_mdp_bounds;
-        if(have_bounds) {
+        auto & [cached_bounds,quotient_mdp_bounds] = this->quotient_mdp_bounds_cache[formula_index];
+        if(have_bounds and cached_bounds != mdp_bounds) {
             auto const& mdp_values = mdp_bounds->getValueVector();
-            quotient_mdp_bounds.resize(this->quotient_mdp.getNumberOfStates());
+            quotient_mdp_bounds.assign(this->quotient_mdp.getNumberOfStates(), 0);
             uint64_t mdp_states = mdp_values.size();
             for(StateType state = 0; state < mdp_states; state++) {
                 quotient_mdp_bounds[mdp_quotient_state_map[state]] = mdp_values[state];
             }
+            cached_bounds = mdp_bounds;
         }
 
         
@@ -9,6 +9,8 @@
 #include "storm/models/sparse/Dtmc.h"
 #include "storm/utility/Stopwatch.h"
 
+#include <map>
+
 namespace synthesis {
 
     template<typename ValueType = double, typename StateType = uint64_t>
@@ -123,6 +125,10 @@ namespace synthesis {
         uint64_t hole_count;
         // Significant holes in MDP states
         std::vector<std::set<uint64_t>> mdp_holes;
+        // For each formula, the last MDP bounds and their mapping onto the state space of the quotient MDP
+        std::map<uint64_t,std::pair<
+            std::shared_ptr<storm::modelchecker::ExplicitQuantitativeCheckResult<ValueType> const>,std::vector<ValueType>
+        >> quotient_mdp_bounds_cache;
 
         // Formula bounds: safety (<,<=) or liveness (>,>=)
         std::vector<bool> formula_safety;
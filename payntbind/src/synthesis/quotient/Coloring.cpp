@@ -29,6 +29,30 @@ Coloring::Coloring(
     }
 
 
+    // count the choices of each hole-option pair first so that each list is allocated exactly once
+    std::vector<std::vector<uint64_t>> hole_option_num_choices(num_holes);
+    for(uint64_t hole = 0; hole<num_holes; ++hole) {
+        hole_option_num_choices[hole].resize(family.holeNumOptionsTotal(hole),0);
+    }
+    for(uint64_t choice = 0; choice<num_choices; ++choice) {
+        for(auto const& [hole,option]: choice_to_assignment[choice]) {
+            hole_option_num_choices[hole][option]++;
+        }
+    }
+    hole_option_to_choices.resize(num_holes);
+    for(uint64_t hole = 0; hole<num_holes; ++hole) {
+        hole_option_to_choices[hole].resize(family.holeNumOptionsTotal(hole));
+        for(uint64_t option = 0; option<family.holeNumOptionsTotal(hole); ++option) {
+            hole_option_to_choices[hole][option].reserve(hole_option_num_choices[hole][option]);
+        }
+    }
+    for(uint64_t choice = 0; choice<num_choices; ++choice) {
+        for(auto const& [hole,option]: choice_to_assignment[choice]) {
+            hole_option_to_choices[hole][option].push_back(choice);
+        }
+    }
+
+
     auto num_states = row_groups.size()-1;
     state_to_holes.resize(num_states);
     for(uint64_t state = 0; state<num_states; ++state) {
@@ -51,11 +75,51 @@ std::vector<BitVector> const& Coloring::getStateToHoles() const {
     return state_to_holes;
 }
 
+std::vector<std::set<uint64_t>> Coloring::getStateToHoleIndices() const {
+    std::vector<std::set<uint64_t>> state_to_hole_indices(state_to_holes.size());
+    for(uint64_t state = 0; state<state_to_holes.size(); ++state) {
+        state_to_hole_indices[state].insert(state_to_holes[state].begin(), state_to_holes[state].end());
+    }
+    return state_to_hole_indices;
+}
+
 BitVector Coloring::selectCompatibleChoices(Family const& subfamily) const {
-    auto selection = BitVector(uncolored_choices);
-    for(auto choice: colored_choices) {
-        if(subfamily.includesAssignment(choice_to_assignment[choice])) {
-            selection.set(choice,true);
+    if(subfamily.isAssignment()) {
+        // single assignment: collect choices labeled by the assigned options (far fewer than the ones labeled by
+        // the excluded options) and keep those whose colors all agree with the assignment
+        auto selection = BitVector(uncolored_choices);
+        for(uint64_t hole = 0; hole < subfamily.numHoles(); ++hole) {
+            for(auto choice: hole_option_to_choices[hole][subfamily.holeOptions(hole)[0]]) {
+                if(not selection.get(choice) and subfamily.includesAssignment(choice_to_assignment[choice])) {
+                    selection.set(choice,true);
+                }
+            }
+        }
+        return selection;
+    }
+
+    // process the family hole by hole: unrestricted holes are skipped, for restricted holes we remove choices
+    // labeled by the excluded options
+    auto selection = BitVector(numChoices(),true);
+    for(uint64_t hole = 0; hole < subfamily.numHoles(); ++hole) {
+        if(subfamily.holeNumOptions(hole) == subfamily.holeNumOptionsTotal(hole)) {
+            continue;
+        }
+        // iterate over the excluded options word-wise via the complement of the option mask
+        for(auto option: ~subfamily.holeOptionsMask(hole)) {
+            for(auto choice: hole_option_to_choices[hole][option]) {
+                selection.set(choice,false);
+            }
+        }
+    }
+    return selection;
+}
+
+BitVector Coloring::selectCompatibleChoices(Family const& subfamily, BitVector const& parent_choices, uint64_t hole) const {
+    auto selection = BitVector(parent_choices);
+    for(auto option: ~subfamily.holeOptionsMask(hole)) {
+        for(auto choice: hole_option_to_choices[hole][option]) {
+            selection.set(choice,false);
         }
     }
     return selection;
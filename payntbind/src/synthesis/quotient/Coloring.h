@@ -5,6 +5,7 @@
 #include <storm/storage/BitVector.h>
 
 #include <cstdint>
+#include <set>
 #include <vector>
 #include <memory>
 
@@ -25,9 +26,16 @@ public:
     std::vector<std::vector<std::pair<uint64_t,uint64_t>>> const& getChoiceToAssignment() const;
     /** Get a mapping from states to holes involved in its choices. */
     std::vector<BitVector> const& getStateToHoles() const;
+    /** Get a mapping from states to indices of holes involved in its choices. */
+    std::vector<std::set<uint64_t>> getStateToHoleIndices() const;
     
     /** Get a mask of choices compatible with the family. */
     BitVector selectCompatibleChoices(Family const& subfamily) const;
+    /**
+     * Get a mask of choices compatible with the family, assuming that the family differs from its parent only in the
+     * options of the given hole and that the parent selected the given choices.
+     */
+    BitVector selectCompatibleChoices(Family const& subfamily, BitVector const& parent_choices, uint64_t hole) const;
     /** For each hole, collect options (colors) involved in any of the given choices. */
     std::vector<std::vector<uint64_t>> collectHoleOptions(BitVector const& choices) const;
     
@@ -45,6 +53,8 @@ protected:
     std::vector<BitVector> choice_to_holes;
     /** For each state, identification of holes associated with its choices. */
     std::vector<BitVector> state_to_holes;
+    /** For each hole and each of its options, a list of choices labeled by this hole-option pair. */
+    std::vector<std::vector<std::vector<uint64_t>>> hole_option_to_choices;
 
     /** Choices not labeled by any hole. */
     BitVector uncolored_choices;
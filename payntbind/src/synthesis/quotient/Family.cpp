@@ -5,13 +5,8 @@
 
 namespace synthesis {
 
-Family::Family(Family const& other) {
-    hole_options = std::vector<std::vector<uint64_t>>(other.numHoles());
-    hole_options_mask = std::vector<BitVector>(other.numHoles());
-    for(uint64_t hole = 0; hole < numHoles(); ++hole) {
-        hole_options[hole] = other.holeOptions(hole);
-        hole_options_mask[hole] = other.holeOptionsMask(hole);
-    }
+Family::Family(Family const& other) : hole_options(other.hole_options), hole_options_mask(other.hole_options_mask) {
+    // choices are specific to the family and are not copied
 }
 
 uint64_t Family::numHoles() const {
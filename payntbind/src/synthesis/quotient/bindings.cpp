@@ -19,6 +19,8 @@
 
 #include <storm/storage/Scheduler.h>
 
+#include <algorithm>
+
 #include <storm/adapters/RationalNumberAdapter.h>
 
 #include <z3++.h>
@@ -56,17 +58,20 @@ template<typename ValueType>
 std::pair<storm::storage::BitVector,std::vector<std::vector<std::pair<uint64_t,uint64_t>>>> janiMapChoicesToHoleAssignments(
     storm::models::sparse::Mdp<ValueType> const& mdp,
     Family const& family,
-    std::map<uint64_t,std::vector<std::pair<uint64_t,uint64_t>>> edge_to_hole_assignment
+    std::map<uint64_t,std::vector<std::pair<uint64_t,uint64_t>>> const& edge_to_hole_assignment
 ) {
 
+    auto const& choice_origins = mdp.getChoiceOrigins()->asJaniChoiceOrigins();
     uint64_t num_choices = mdp.getNumberOfChoices();
     storm::storage::BitVector choice_is_valid(num_choices,true);
     std::vector<std::vector<std::pair<uint64_t,uint64_t>>> choice_to_hole_assignment(num_choices);
+    // for each hole, whether it was set by the current choice; only the set holes are reset after each choice
+    std::vector<bool> hole_set(family.numHoles(),false);
+    std::vector<uint64_t> hole_option(family.numHoles());
+    std::vector<uint64_t> holes_set;
     for(uint64_t choice = 0; choice < num_choices; ++choice) {
-        std::vector<bool> hole_set(family.numHoles(),false);
-        std::vector<uint64_t> hole_option(family.numHoles());
         bool valid_choice = true;
-        for(auto const& edge: mdp.getChoiceOrigins()->asJaniChoiceOrigins().getEdgeIndexSet(choice)) {
+        for(auto const& edge: choice_origins.getEdgeIndexSet(choice)) {
             auto hole_assignment = edge_to_hole_assignment.find(edge);
             if(hole_assignment == edge_to_hole_assignment.end()) {
                 continue;
@@ -75,6 +80,7 @@ std::pair<storm::storage::BitVector,std::vector<std::vector<std::pair<uint64_t,u
                 if(not hole_set[hole]) {
                     hole_option[hole] = option;
                     hole_set[hole] = true;
+                    holes_set.push_back(hole);
                 } else if(hole_option[hole] != option) {
                     valid_choice = false;
                     break;
@@ -84,16 +90,19 @@ std::pair<storm::storage::BitVector,std::vector<std::vector<std::pair<uint64_t,u
                 break;
             }
         }
-        if(not valid_choice) {
+        if(valid_choice) {
+            std::sort(holes_set.begin(),holes_set.end());
+            choice_to_hole_assignment[choice].reserve(holes_set.size());
+            for(uint64_t hole: holes_set) {
+                choice_to_hole_assignment[choice].push_back(std::make_pair(hole,hole_option[hole]));
+            }
+        } else {
             choice_is_valid.set(choice,false);
-            continue;
         }
-        for(uint64_t hole = 0; hole < family.numHoles(); ++hole) {
-            if(not hole_set[hole]) {
-                continue;
-            }
-            choice_to_hole_assignment[choice].push_back(std::make_pair(hole,hole_option[hole]));
+        for(uint64_t hole: holes_set) {
+            hole_set[hole] = false;
         }
+        holes_set.clear();
     }
     return std::make_pair(choice_is_valid,choice_to_hole_assignment);
 }
@@ -321,7 +330,9 @@ void bindings_coloring(py::module& m) {
         >())
         .def("getChoiceToAssignment", &synthesis::Coloring::getChoiceToAssignment)
         .def("getStateToHoles", &synthesis::Coloring::getStateToHoles)
-        .def("selectCompatibleChoices", &synthesis::Coloring::selectCompatibleChoices)
+        .def("getStateToHoleIndices", &synthesis::Coloring::getStateToHoleIndices)
+        .def("selectCompatibleChoices", py::overload_cast<synthesis::Family const&>(&synthesis::Coloring::selectCompatibleChoices, py::const_))
+        .def("selectCompatibleChoices", py::overload_cast<synthesis::Family const&, storm::storage::BitVector const&, uint64_t>(&synthesis::Coloring::selectCompatibleChoices, py::const_))
         .def("collectHoleOptions", &synthesis::Coloring::collectHoleOptions)
         ;
 
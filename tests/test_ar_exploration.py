@@ -0,0 +1,61 @@
+import math
+import types
+
+import pytest
+
+from paynt.synthesizer.synthesizer_ar import FamilyWorklist, SynthesizerAR
+
+
+def undecided_family(value=None, minimizing=True):
+    ''' :return stand-in for an analysed family with the given bound on the optimality property (None if absent) '''
+    optimality_result = None
+    if value is not None:
+        primary = types.SimpleNamespace(value=value)
+        optimality_result = types.SimpleNamespace(primary=primary, minimizing=minimizing)
+    analysis_result = types.SimpleNamespace(optimality_result=optimality_result)
+    return types.SimpleNamespace(analysis_result=analysis_result)
+
+
+@pytest.fixture
+def best_first(monkeypatch):
+    monkeypatch.setattr(SynthesizerAR, "exploration_order_best_first", True)
+
+
+def pop_all(worklist):
+    popped = []
+    while worklist:
+        popped.append(worklist.pop())
+    return popped
+
+
+def test_worklist_same_priority_is_depth_first():
+    worklist = FamilyWorklist()
+    for family in ["a", "b", "c"]:
+        worklist.push(family)
+    assert pop_all(worklist) == ["c", "b", "a"]
+
+
+def test_worklist_pops_lower_priority_first():
+    worklist = FamilyWorklist()
+    worklist.push("a", 2)
+    worklist.push("b", math.inf)
+    worklist.push("c", -1)
+    worklist.push("d", 2)
+    assert pop_all(worklist) == ["c", "d", "a", "b"]
+
+
+def test_split_priority_depth_first_is_constant():
+    assert not SynthesizerAR.exploration_order_best_first
+    for family in [undecided_family(), undecided_family(5), undecided_family(5, minimizing=False)]:
+        assert SynthesizerAR.split_priority(None, family) == 0
+
+
+@pytest.mark.parametrize("minimizing", [True, False])
+def test_split_priority_best_first(best_first, minimizing):
+    values = [3, -2, 7]
+    worklist = FamilyWorklist()
+    worklist.push("unbounded", SynthesizerAR.split_priority(None, undecided_family()))
+    for value in values:
+        worklist.push(value, SynthesizerAR.split_priority(None, undecided_family(value, minimizing)))
+    expected = sorted(values, reverse=not minimizing) + ["unbounded"]
+    assert pop_all(worklist) == expected
@@ -0,0 +1,81 @@
+import importlib.util
+import itertools
+
+import pytest
+
+import paynt.family.family
+import paynt.family.smt
+
+
+backends = [
+    pytest.param(False, id="smt"),
+    pytest.param(True, id="bdd", marks=pytest.mark.skipif(
+        importlib.util.find_spec('dd') is None, reason="BDD package dd is not installed"
+    )),
+]
+
+
+@pytest.fixture(params=backends)
+def use_bdd_backend(request, monkeypatch):
+    monkeypatch.setattr(paynt.family.smt.SmtSolver, "use_bdd_backend", request.param)
+    return request.param
+
+
+def create_family():
+    family = paynt.family.family.Family()
+    family.add_hole("a", ["0", "1", "2"])
+    family.add_hole("b", ["0", "1"])
+    family.add_hole("c", ["0", "1", "2"])
+    return family
+
+
+def create_solver(family, use_bdd_backend):
+    smt_solver = paynt.family.smt.SmtSolver(family)
+    assert smt_solver.use_bdd == use_bdd_backend
+    return smt_solver
+
+
+def enumerate_members(smt_solver, family):
+    ''' :return all members of the family picked by the solver, excluding each picked member '''
+    members = []
+    while True:
+        assignment = smt_solver.pick_assignment(family)
+        if assignment is None:
+            return members
+        members.append(tuple(assignment.hole_options(hole)[0] for hole in range(family.num_holes)))
+        smt_solver.exclude_conflict(family, assignment, set(range(family.num_holes)))
+
+
+def all_members(family):
+    return set(itertools.product(*[family.hole_options(hole) for hole in range(family.num_holes)]))
+
+
+def test_pick_enumerates_all_members(use_bdd_backend):
+    family = create_family()
+    smt_solver = create_solver(family, use_bdd_backend)
+    members = enumerate_members(smt_solver, family)
+    assert len(members) == len(set(members))
+    assert set(members) == all_members(family)
+
+
+def test_conflict_excludes_conflicting_members(use_bdd_backend):
+    family = create_family()
+    smt_solver = create_solver(family, use_bdd_backend)
+    family.encode(smt_solver)
+    assignment = family.assume_assignment_copy([1, 0, 2])
+    pruning_estimate = smt_solver.exclude_conflict(family, assignment, {0, 2})
+    assert pruning_estimate == 2
+    expected = {member for member in all_members(family) if not (member[0] == 1 and member[2] == 2)}
+    assert set(enumerate_members(smt_solver, family)) == expected
+
+
+def test_conflict_in_subfamily_excludes_subfamily_members_only(use_bdd_backend):
+    family = create_family()
+    smt_solver = create_solver(family, use_bdd_backend)
+    subfamily = family.assume_hole_options_copy(0, [1, 2])
+    subfamily.encode(smt_solver)
+    assignment = subfamily.assume_assignment_copy([1, 0, 0])
+    pruning_estimate = smt_solver.exclude_conflict(subfamily, assignment, {2})
+    assert pruning_estimate == 2*2
+    expected = {member for member in all_members(family) if not (member[0] in [1, 2] and member[2] == 0)}
+    assert set(enumerate_members(smt_solver, family)) == expected
@@ -0,0 +1,27 @@
+import stormpy
+
+import paynt.verification.property
+
+
+def construct_property(formula_str):
+    prop = stormpy.parse_properties_without_context(formula_str)[0]
+    return paynt.verification.property.construct_property(prop, 0)
+
+
+def test_dtmc_formula_key_ignores_direction_and_bound():
+    prop = construct_property('P>=0.5 [F "goal"]')
+    prop_alt = construct_property('Pmin=? [F "goal"]')
+    assert prop.dtmc_formula_key == prop_alt.dtmc_formula_key
+
+
+def test_dtmc_formula_key_distinguishes_operators():
+    keys = [
+        construct_property(formula_str).dtmc_formula_key for formula_str in [
+            'P>=0.5 [F "goal"]', 'T<=5 [F "goal"]', 'R{"steps"}<=5 [F "goal"]', 'R{"cost"}<=5 [F "goal"]',
+        ]
+    ]
+    assert len(set(keys)) == len(keys)
+    prop_prob = construct_property('P>=0.5 [F "goal"]')
+    prop_lra = construct_property('LRA>=0.5 ["goal"]')
+    assert prop_prob.dtmc_formula_key[0] == "P"
+    assert prop_lra.dtmc_formula_key[0] == "LRA"
@@ -1,6 +1,8 @@
 import unittest
 import subprocess
 import logging
+import re
+import importlib.util
 
 from test_utils import PayntTestUtils
 
@@ -93,6 +95,41 @@ class SynthesisTestSuite(unittest.TestCase):
 
         self.run_grid_optimal_for_oracle('CEGAR')
 
+    def run_paynt(self, project, *args):
+        process = subprocess.Popen([
+            'python3',
+            PayntTestUtils.get_path_to_paynt_executable(),
+            PayntTestUtils.get_path_to_models() + project,
+            *args,
+        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = process.communicate()
+        self.assertEqual(0, process.returncode, stderr.decode())
+        optimum = re.search(r"optimum: (\S+)", stdout.decode())
+        self.assertIsNotNone(optimum, stdout.decode())
+        return optimum.group(1)
+
+    def assert_same_optimum(self, project, args, variants):
+        ''' Run paynt on the project with the common args extended by each of the variants, compare the optima. '''
+        optima = [self.run_paynt(project, *args, *variant) for variant in variants]
+        for variant,optimum in zip(variants[1:],optima[1:]):
+            self.assertEqual(optima[0], optimum, f"{project} {args}: {variants[0]} vs. {variant}")
+
+    def test_ar_abstraction_precision(self):
+        self.assert_same_optimum('/dtmc/kydie', ['--method', 'ar'], [[], ['--abstraction-precision', '1e-2']])
+
+    @unittest.skipIf(importlib.util.find_spec('dd') is None, "BDD package dd is not installed")
+    def test_bdd_design_space(self):
+        for method in ['cegis', 'hybrid']:
+            with self.subTest(method=method):
+                self.assert_same_optimum('/dtmc/kydie', ['--method', method], [[], ['--bdd-design-space']])
+
+    def test_ar_exploration(self):
+        benchmarks = [('/dtmc/kydie', []), ('/dtmc/grid/grid', ['--props', 'hard.props'])]
+        for project,args in benchmarks:
+            with self.subTest(project=project):
+                self.assert_same_optimum(project, ['--method', 'ar', *args],
+                    [['--ar-exploration', 'dfs'], ['--ar-exploration', 'best']])
+
     # def test_grid_optimal_cegis(self):
     #     self.run_grid_optimal_for_oracle('CEGIS')
     #
@@ -10,15 +10,20 @@ PayntUtils class, which provides auxiliary methods for the tests
 
 
 class PayntTestUtils:
-    ROOT_DIR = "./../.."
+    ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
     @staticmethod
     def get_path_to_paynt_executable():
-        assert "paynt.py" in os.listdir(PayntTestUtils.ROOT_DIR + "/paynt/")
-        return PayntTestUtils.ROOT_DIR + "/paynt/paynt.py"
+        assert "paynt.py" in os.listdir(PayntTestUtils.ROOT_DIR)
+        return PayntTestUtils.ROOT_DIR + "/paynt.py"
 
     @staticmethod
     def get_path_to_workspace_examples():
         assert "workspace" in os.listdir(PayntTestUtils.ROOT_DIR)
         assert "examples" in os.listdir(PayntTestUtils.ROOT_DIR + "/workspace")
         return PayntTestUtils.ROOT_DIR + "/workspace/examples"
+
+    @staticmethod
+    def get_path_to_models():
+        assert "models" in os.listdir(PayntTestUtils.ROOT_DIR)
+        return PayntTestUtils.ROOT_DIR + "/models"